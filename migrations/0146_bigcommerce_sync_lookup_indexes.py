@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Composite indexes for the BigCommerce sync lookups in ``_categorize_products_for_sync``:
+    ``bigcommerce_parts`` by (company_destination, sku) and ``company_destination_parts`` by
+    (company_destination, brand, part_unique_key). The existing unique constraint on
+    bigcommerce_parts leads with external_id, so it can't serve the SKU lookup.
+    """
+
+    dependencies = [
+        ("src", "0145_quadratec_provider"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bigcommerceparts",
+            index=models.Index(fields=["company_destination", "sku"], name="bc_parts_dest_sku_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="companydestinationparts",
+            index=models.Index(
+                fields=["company_destination", "brand", "part_unique_key"],
+                name="cdp_dest_brand_key_idx",
+            ),
+        ),
+    ]
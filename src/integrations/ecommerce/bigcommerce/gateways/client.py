@@ -4,6 +4,7 @@ import requests
 import logging
 import simplejson
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 from ratelimit import limits, sleep_and_retry
 
 from common import enums as common_enums
@@ -19,6 +20,13 @@ logger = logging.getLogger(__name__)
 # Using conservative default of 150 per 30 seconds (safe for Standard/Plus)
 REQUESTS_PER_30_SECONDS = 150
 
+# When the store's remaining quota (X-Rate-Limit-Requests-Left) drops to this, wait for the window
+# to reset before the next call instead of running into 429s with several sync workers in flight
+RATE_LIMIT_REQUESTS_LEFT_THRESHOLD = 5
+
+# Connections kept open per client; enough for the parallel sync workers sharing one client
+SESSION_POOL_MAXSIZE = 10
+
 
 class BigCommerceApiClient(object):
     API_BASE_URL = "https://api.bigcommerce.com/stores"
@@ -34,6 +42,16 @@ class BigCommerceApiClient(object):
         if not self.store_hash or not self.access_token:
             raise ValueError("Invalid credentials parameter. Both store_hash and access_token are required.")
 
+        # Reuse keep-alive connections across calls instead of a new TCP/TLS handshake per request.
+        # Retries stay in _request, so the adapter does not retry on its own.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=SESSION_POOL_MAXSIZE))
+        self._session.headers.update({
+            "X-Auth-Token": self.access_token,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+
     @sleep_and_retry
     @limits(calls=REQUESTS_PER_30_SECONDS, period=30)  # BigCommerce quota refreshes every 30 seconds
     def _request(
@@ -45,20 +63,14 @@ class BigCommerceApiClient(object):
             max_retries: int = 3,
     ) -> requests.Response:
         url = f"{self.API_BASE_URL}/{self.store_hash}/v3/{endpoint}"
-        headers = {
-            "X-Auth-Token": self.access_token,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
 
         for attempt in range(max_retries):
             try:
-                response = requests.request(
+                response = self._session.request(
                     url=url,
                     method=method.value,
                     params=params,
                     json=payload,
-                    headers=headers,
                 )
 
                 # Handle rate limit (429) responses
@@ -87,6 +99,7 @@ class BigCommerceApiClient(object):
 
                 # Log rate limit headers for monitoring
                 self._log_rate_limit_headers(response, endpoint)
+                self._wait_if_quota_nearly_exhausted(response, endpoint)
 
                 logger.debug(
                     f"{self.LOG_PREFIX} Successful response (endpoint={endpoint}, status_code={response.status_code}, payload={payload}, params={params}, raw_response={response.content.decode('utf-8')})."
@@ -130,7 +143,31 @@ class BigCommerceApiClient(object):
                 f"{self.LOG_PREFIX} Rate limit headers (endpoint={endpoint}): {rate_limit_headers}"
             )
 
-    def get_brands(self, page: int = 1) -> typing.Tuple[typing.List[typing.Dict], typing.Optional[int]]:
+    def _wait_if_quota_nearly_exhausted(self, response: requests.Response, endpoint: str) -> None:
+        requests_left_header = response.headers.get("X-Rate-Limit-Requests-Left")
+        if not requests_left_header:
+            return
+
+        try:
+            requests_left = int(requests_left_header)
+        except (ValueError, TypeError):
+            return
+
+        if requests_left > RATE_LIMIT_REQUESTS_LEFT_THRESHOLD:
+            return
+
+        reset_ms = self._extract_retry_after_ms(response)
+        if not reset_ms:
+            return
+
+        wait_time_seconds = reset_ms / 1000.0
+        logger.info(
+            f"{self.LOG_PREFIX} Rate limit nearly exhausted (endpoint={endpoint}, requests_left={requests_left}). "
+            f"Waiting {wait_time_seconds:.2f} seconds for the quota window to reset."
+        )
+        time.sleep(wait_time_seconds)
+
+    def get_brands(self, page: int = 1) -> typing.Tuple[typing.List[typing.Dict], typing.Optional[int], int]:
         response = simplejson.loads(
             self._request(
                 endpoint="catalog/brands",
@@ -147,9 +184,9 @@ class BigCommerceApiClient(object):
         potential_next_page = page + 1
         next_page = None if page >= total_pages else potential_next_page
 
-        return data, next_page
+        return data, next_page, total_pages
 
-    def get_products(self, page: int = 1) -> typing.Tuple[typing.List[typing.Dict], typing.Optional[int]]:
+    def get_products(self, page: int = 1) -> typing.Tuple[typing.List[typing.Dict], typing.Optional[int], int]:
         response = simplejson.loads(
             self._request(
                 endpoint="catalog/products",
@@ -166,7 +203,7 @@ class BigCommerceApiClient(object):
         potential_next_page = page + 1
         next_page = None if page >= total_pages else potential_next_page
 
-        return data, next_page
+        return data, next_page, total_pages
 
     def create_product(self, product_data: typing.Dict) -> typing.Dict:
         response = simplejson.loads(
@@ -1,13 +1,17 @@
+import collections
 import dataclasses
+import functools
+import html
 import json
 import logging
+import math
 import typing
 import time
 import threading
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote, urlparse, urlunparse
-from django.db.models import F
+from django.db.models import Exists, F, OuterRef
 from django.db.models.functions import TruncWeek
 from django.utils import timezone
 import pgbulk
@@ -32,97 +36,156 @@ _PARALLEL_REQUEST_DELAY = 0.0  # Base delay in seconds between parallel requests
 _PARALLEL_REQUEST_DELAY_JITTER = 0.0  # Random jitter to add to delay (0 to this value)
 _SERVER_ERROR_RETRY_DELAY = 2  # Additional delay for 500 errors (in seconds)
 
+# Rows per pgbulk.upsert statement when saving fetched brands/products (products are collected across pages)
+_UPSERT_BATCH_SIZE = 500
+
+# SKUs per IN (...) lookup when matching products to existing BigCommerce / destination parts
+_SKU_LOOKUP_CHUNK_SIZE = 1000
+
+
+# Pages requested ahead of the one being processed when fetching brands/products
+_PAGE_PREFETCH_DEPTH = 4
+
+# Columns written when a sync run finishes (updated_at must be listed for auto_now to apply)
+_EXECUTION_RUN_FINISH_FIELDS = [
+    'status', 'status_name', 'message', 'error_message', 'completed_at', 'products_processed',
+    'products_created', 'products_updated', 'products_failed', 'updated_at',
+]
+
+
+def _prefetch_pages(
+    page_fetcher: ThreadPoolExecutor,
+    fetch_page: typing.Callable,
+    first_page: int = 1
+) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+    """
+    Yield (page, future) in page order, keeping up to _PAGE_PREFETCH_DEPTH page requests in flight.
+    fetch_page returns (data, next_page, total_pages); the first page is requested on its own, and
+    read-ahead never goes past the latest reported total_pages, so no quota is spent on empty pages.
+    """
+    pending = collections.deque([(first_page, page_fetcher.submit(fetch_page, page=first_page))])
+    next_page_to_submit = first_page + 1
+    try:
+        while pending:
+            page, page_future = pending.popleft()
+            yield page, page_future
+
+            try:
+                _, next_page, total_pages = page_future.result()
+            except Exception:
+                return
+            if next_page is None:
+                return
+
+            while len(pending) < _PAGE_PREFETCH_DEPTH and next_page_to_submit <= total_pages:
+                pending.append((next_page_to_submit, page_fetcher.submit(fetch_page, page=next_page_to_submit)))
+                next_page_to_submit += 1
+    finally:
+        # Requests still queued when the caller stops early (or after an error)
+        for _, page_future in pending:
+            page_future.cancel()
+
 
 def fetch_and_save_all_bigcommerce_brands() -> None:
-    logger.info('{} Started fetching and saving BigCommerce brands.'.format(_LOG_PREFIX))
+    logger.info('%s Started fetching and saving BigCommerce brands.', _LOG_PREFIX)
 
-    all_destinations = src_models.CompanyDestinations.objects.filter(
-        destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value
+    all_destinations = list(
+        src_models.CompanyDestinations.objects.filter(
+            destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value
+        ).select_related('company')
     )
 
-    if not all_destinations.exists():
-        logger.info('{} No BigCommerce destinations found.'.format(_LOG_PREFIX))
+    if not all_destinations:
+        logger.info('%s No BigCommerce destinations found.', _LOG_PREFIX)
         return
 
-    logger.info('{} Found {} BigCommerce destinations.'.format(_LOG_PREFIX, all_destinations.count()))
+    logger.info('%s Found %s BigCommerce destinations.', _LOG_PREFIX, len(all_destinations))
 
     for destination in all_destinations:
         company = destination.company
         credentials = destination.credentials
 
-        logger.info('{} Processing destination: {} (company: {}).'.format(
+        logger.info(
+            '%s Processing destination: %s (company: %s).',
             _LOG_PREFIX, destination.id, company.name
-        ))
+        )
 
         try:
             api_client = bigcommerce_client.BigCommerceApiClient(credentials=credentials)
         except ValueError as e:
-            logger.error('{} Invalid credentials for destination: {} (company: {}). Error: {}. Skipping.'.format(
+            logger.error(
+                '%s Invalid credentials for destination: %s (company: %s). Error: %s. Skipping.',
                 _LOG_PREFIX, destination.id, company.name, str(e)
-            ))
+            )
             continue
 
-        page = 1
         total_processed = 0
         total_skipped = 0
 
-        while page is not None:
-            try:
-                brands_data, next_page = api_client.get_brands(page=page)
-            except bigcommerce_exceptions.BigCommerceAPIException as e:
-                logger.error('{} BigCommerce API error for destination: {} (company: {}), page: {}. Error: {}. Skipping destination.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page, str(e)
-                ))
-                break
-
-            if not brands_data:
-                logger.warning('{} No brands data returned for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page
-                ))
-                page = next_page
-                continue
+        # Upcoming pages are fetched in the background while the current one is transformed and upserted
+        with ThreadPoolExecutor(max_workers=_PAGE_PREFETCH_DEPTH) as page_fetcher:
+            for page, page_future in _prefetch_pages(page_fetcher, api_client.get_brands):
+                try:
+                    brands_data, _, _ = page_future.result()
+                except bigcommerce_exceptions.BigCommerceAPIException as e:
+                    logger.error(
+                        '%s BigCommerce API error for destination: %s (company: %s), page: %s. Error: %s. Skipping destination.',
+                        _LOG_PREFIX, destination.id, company.name, page, str(e)
+                    )
+                    break
 
-            logger.info('{} Fetched {} brands for destination: {} (company: {}), page: {}.'.format(
-                _LOG_PREFIX, len(brands_data), destination.id, company.name, page
-            ))
+                if not brands_data:
+                    logger.warning(
+                        '%s No brands data returned for destination: %s (company: %s), page: %s.',
+                        _LOG_PREFIX, destination.id, company.name, page
+                    )
+                    continue
 
-            brand_instances = _transform_brands_data(brands_data, destination, company)
+                logger.info(
+                    '%s Fetched %s brands for destination: %s (company: %s), page: %s.',
+                    _LOG_PREFIX, len(brands_data), destination.id, company.name, page
+                )
 
-            if not brand_instances:
-                logger.warning('{} No valid brand instances created for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page
-                ))
-                page = next_page
-                continue
+                brand_instances = _transform_brands_data(brands_data, destination, company)
 
-            try:
-                upserted_brands = pgbulk.upsert(
-                    src_models.BigCommerceBrands,
-                    brand_instances,
-                    unique_fields=['external_id', 'brand', 'company_destination'],
-                    update_fields=['name'],
-                    returning=True,
-                )
+                if not brand_instances:
+                    logger.warning(
+                        '%s No valid brand instances created for destination: %s (company: %s), page: %s.',
+                        _LOG_PREFIX, destination.id, company.name, page
+                    )
+                    continue
 
-                processed_count = len(upserted_brands) if upserted_brands else 0
-                total_processed += processed_count
-                total_skipped += len(brands_data) - processed_count
+                try:
+                    processed_count = 0
+                    for i in range(0, len(brand_instances), _UPSERT_BATCH_SIZE):
+                        brand_batch = brand_instances[i : i + _UPSERT_BATCH_SIZE]
+                        # Every row is inserted or updated, so the batch size is the count; no RETURNING needed
+                        pgbulk.upsert(
+                            src_models.BigCommerceBrands,
+                            brand_batch,
+                            unique_fields=['external_id', 'brand', 'company_destination'],
+                            update_fields=['name'],
+                        )
+                        processed_count += len(brand_batch)
 
-                logger.info('{} Successfully upserted {} brands for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, processed_count, destination.id, company.name, page
-                ))
-            except Exception as e:
-                logger.error('{} Error during bulk upsert for destination: {} (company: {}), page: {}. Error: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page, str(e)
-                ))
-                page = next_page
-                continue
+                    total_processed += processed_count
+                    total_skipped += len(brands_data) - processed_count
 
-            page = next_page
+                    logger.info(
+                        '%s Successfully upserted %s brands for destination: %s (company: %s), page: %s.',
+                        _LOG_PREFIX, processed_count, destination.id, company.name, page
+                    )
+                except Exception as e:
+                    logger.error(
+                        '%s Error during bulk upsert for destination: %s (company: %s), page: %s. Error: %s.',
+                        _LOG_PREFIX, destination.id, company.name, page, str(e)
+                    )
+                    continue
 
-        logger.info('{} Completed fetching brands for destination: {} (company: {}). Processed: {}, Skipped: {}.'.format(
+        logger.info(
+            '%s Completed fetching brands for destination: %s (company: %s). Processed: %s, Skipped: %s.',
             _LOG_PREFIX, destination.id, company.name, total_processed, total_skipped
-        ))
+        )
 
 
 def _transform_brands_data(
@@ -132,196 +195,259 @@ def _transform_brands_data(
 ) -> typing.List[src_models.BigCommerceBrands]:
     brand_instances = []
 
+    # Resolve the whole page in one query instead of three per brand; the CompanyBrands and
+    # BrandProviders checks ride along as EXISTS subqueries
+    brand_names = {
+        str(brand_data.get('name') or '').strip().upper() for brand_data in brands_data
+    }
+    brand_names.discard('')
+
+    # name -> (brand_id, has_company_brand, has_brand_provider); plain tuples, no Brands instances
+    brands_by_name = {}
+    for brand_id, brand_name, has_company_brand, has_brand_provider in src_models.Brands.objects.filter(
+        name__in=brand_names
+    ).annotate(
+        has_company_brand=Exists(
+            src_models.CompanyBrands.objects.filter(company=company, brand_id=OuterRef('pk'))
+        ),
+        has_brand_provider=Exists(
+            src_models.BrandProviders.objects.filter(brand_id=OuterRef('pk'))
+        ),
+    ).order_by('id').values_list('id', 'name', 'has_company_brand', 'has_brand_provider'):
+        # Brands.name is not unique; keep the first match like .first() did
+        brands_by_name.setdefault(brand_name, (brand_id, has_company_brand, has_brand_provider))
+
+    # Bound once outside the per-brand loop
+    bigcommerce_brands_model = src_models.BigCommerceBrands
+    destination_id = destination.id
+
     for brand_data in brands_data:
         try:
             external_id = str(brand_data.get('id', ''))
             name = brand_data.get('name', '').strip()
 
             if not external_id or not name:
-                logger.warning('{} Skipping brand with missing external_id or name: {}'.format(
+                logger.warning(
+                    '%s Skipping brand with missing external_id or name: %s',
                     _LOG_PREFIX, brand_data
-                ))
+                )
                 continue
 
             brand_name_upper = name.upper()
-            brand = src_models.Brands.objects.filter(name=brand_name_upper).first()
+            brand = brands_by_name.get(brand_name_upper)
 
             if not brand:
-                logger.debug('{} Brand not found in Brands table: {}. Skipping.'.format(
+                logger.debug(
+                    '%s Brand not found in Brands table: %s. Skipping.',
                     _LOG_PREFIX, brand_name_upper
-                ))
+                )
                 continue
 
-            company_brand = src_models.CompanyBrands.objects.filter(
-                company=company,
-                brand=brand
-            ).first()
+            brand_id, has_company_brand, has_brand_provider = brand
 
-            if not company_brand:
-                logger.debug('{} Brand {} not found in CompanyBrands for company: {}. Skipping.'.format(
+            if not has_company_brand:
+                logger.debug(
+                    '%s Brand %s not found in CompanyBrands for company: %s. Skipping.',
                     _LOG_PREFIX, brand_name_upper, company.name
-                ))
+                )
                 continue
 
-            brand_provider = src_models.BrandProviders.objects.filter(
-                brand=brand
-            ).first()
-
-            if not brand_provider:
-                logger.debug('{} Brand {} not found in BrandProviders. Skipping.'.format(
+            if not has_brand_provider:
+                logger.debug(
+                    '%s Brand %s not found in BrandProviders. Skipping.',
                     _LOG_PREFIX, brand_name_upper
-                ))
+                )
                 continue
 
-            brand_instance = src_models.BigCommerceBrands(
+            brand_instance = bigcommerce_brands_model(
                 external_id=external_id,
                 name=name,
-                brand=brand,
-                company_destination=destination,
+                brand_id=brand_id,
+                company_destination_id=destination_id,
             )
 
             brand_instances.append(brand_instance)
 
         except Exception as e:
-            logger.warning('{} Error transforming brand data {}: {}. Skipping.'.format(
+            logger.warning(
+                '%s Error transforming brand data %s: %s. Skipping.',
                 _LOG_PREFIX, brand_data, str(e)
-            ))
+            )
             continue
 
     return brand_instances
 
 
 def fetch_and_save_all_bigcommerce_products() -> None:
-    logger.info('{} Started fetching and saving BigCommerce products.'.format(_LOG_PREFIX))
+    logger.info('%s Started fetching and saving BigCommerce products.', _LOG_PREFIX)
 
-    all_destinations = src_models.CompanyDestinations.objects.filter(
-        destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value
+    all_destinations = list(
+        src_models.CompanyDestinations.objects.filter(
+            destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value
+        ).select_related('company')
     )
 
-    if not all_destinations.exists():
-        logger.info('{} No BigCommerce destinations found.'.format(_LOG_PREFIX))
+    if not all_destinations:
+        logger.info('%s No BigCommerce destinations found.', _LOG_PREFIX)
         return
 
-    logger.info('{} Found {} BigCommerce destinations.'.format(_LOG_PREFIX, all_destinations.count()))
+    logger.info('%s Found %s BigCommerce destinations.', _LOG_PREFIX, len(all_destinations))
 
     for destination in all_destinations:
         company = destination.company
         credentials = destination.credentials
 
-        logger.info('{} Processing destination: {} (company: {}).'.format(
+        logger.info(
+            '%s Processing destination: %s (company: %s).',
             _LOG_PREFIX, destination.id, company.name
-        ))
+        )
 
         try:
             api_client = bigcommerce_client.BigCommerceApiClient(credentials=credentials)
         except ValueError as e:
-            logger.error('{} Invalid credentials for destination: {} (company: {}). Error: {}. Skipping.'.format(
+            logger.error(
+                '%s Invalid credentials for destination: %s (company: %s). Error: %s. Skipping.',
                 _LOG_PREFIX, destination.id, company.name, str(e)
-            ))
+            )
             continue
 
-        page = 1
         total_processed = 0
+        # Keyed by the upsert's unique fields (last wins): offset paging can return a product twice when the
+        # catalog shifts mid-fetch, and a duplicate key inside one ON CONFLICT statement fails the whole batch
+        pending_products = {}
+        pending_first_page = None
+        page = None
+
+        # Upcoming pages are fetched in the background while the current one is transformed and upserted
+        with ThreadPoolExecutor(max_workers=_PAGE_PREFETCH_DEPTH) as page_fetcher:
+            for page, page_future in _prefetch_pages(page_fetcher, api_client.get_products):
+                try:
+                    products_data, _, _ = page_future.result()
+                except bigcommerce_exceptions.BigCommerceAPIException as e:
+                    logger.error(
+                        '%s BigCommerce API error for destination: %s (company: %s), page: %s. Error: %s. Skipping destination.',
+                        _LOG_PREFIX, destination.id, company.name, page, str(e)
+                    )
+                    break
 
-        while page is not None:
-            try:
-                products_data, next_page = api_client.get_products(page=page)
-            except bigcommerce_exceptions.BigCommerceAPIException as e:
-                logger.error('{} BigCommerce API error for destination: {} (company: {}), page: {}. Error: {}. Skipping destination.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page, str(e)
-                ))
-                break
+                if not products_data:
+                    logger.warning(
+                        '%s No products data returned for destination: %s (company: %s), page: %s.',
+                        _LOG_PREFIX, destination.id, company.name, page
+                    )
+                    continue
 
-            if not products_data:
-                logger.warning('{} No products data returned for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page
-                ))
-                page = next_page
-                continue
+                logger.info(
+                    '%s Fetched %s products for destination: %s (company: %s), page: %s.',
+                    _LOG_PREFIX, len(products_data), destination.id, company.name, page
+                )
 
-            logger.info('{} Fetched {} products for destination: {} (company: {}), page: {}.'.format(
-                _LOG_PREFIX, len(products_data), destination.id, company.name, page
-            ))
+                # Instances are collected across pages and upserted in full batches
+                page_instance_count = 0
+                for product_instance in _transform_products_data(products_data, destination):
+                    pending_products[(product_instance.external_id, product_instance.sku)] = product_instance
+                    page_instance_count += 1
 
-            product_instances = _transform_products_data(products_data, destination)
+                if not page_instance_count:
+                    logger.warning(
+                        '%s No valid product instances created for destination: %s (company: %s), page: %s.',
+                        _LOG_PREFIX, destination.id, company.name, page
+                    )
+                    continue
 
-            if not product_instances:
-                logger.warning('{} No valid product instances created for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page
-                ))
-                page = next_page
-                continue
+                if pending_first_page is None:
+                    pending_first_page = page
 
-            try:
-                upserted_products = pgbulk.upsert(
-                    src_models.BigCommerceParts,
-                    product_instances,
-                    unique_fields=['external_id', 'sku', 'company_destination'],
-                    update_fields=['raw_data', 'external_brand_id'],
-                    returning=True,
-                )
+                while len(pending_products) >= _UPSERT_BATCH_SIZE:
+                    batch_keys = list(pending_products)[:_UPSERT_BATCH_SIZE]
+                    total_processed += _upsert_bigcommerce_parts(
+                        [pending_products.pop(key) for key in batch_keys],
+                        destination, company, (pending_first_page, page)
+                    )
+                    # Whatever is left over came from the current page
+                    pending_first_page = page if pending_products else None
 
-                processed_count = len(upserted_products) if upserted_products else 0
-                total_processed += processed_count
+        if pending_products:
+            total_processed += _upsert_bigcommerce_parts(
+                list(pending_products.values()), destination, company, (pending_first_page, page)
+            )
 
-                logger.info('{} Successfully upserted {} products for destination: {} (company: {}), page: {}.'.format(
-                    _LOG_PREFIX, processed_count, destination.id, company.name, page
-                ))
-            except Exception as e:
-                logger.error('{} Error during bulk upsert for destination: {} (company: {}), page: {}. Error: {}.'.format(
-                    _LOG_PREFIX, destination.id, company.name, page, str(e)
-                ))
-                page = next_page
-                continue
+        logger.info(
+            '%s Completed fetching products for destination: %s (company: %s). Processed: %s.',
+            _LOG_PREFIX, destination.id, company.name, total_processed
+        )
 
-            page = next_page
 
-        logger.info('{} Completed fetching products for destination: {} (company: {}). Processed: {}.'.format(
-            _LOG_PREFIX, destination.id, company.name, total_processed
-        ))
+def _upsert_bigcommerce_parts(
+    product_instances: typing.List[src_models.BigCommerceParts],
+    destination: src_models.CompanyDestinations,
+    company: src_models.Company,
+    page_range: typing.Tuple[int, int],
+) -> int:
+    """Upsert one batch of fetched products; returns how many were saved (0 if the upsert failed)."""
+    try:
+        pgbulk.upsert(
+            src_models.BigCommerceParts,
+            product_instances,
+            unique_fields=['external_id', 'sku', 'company_destination'],
+            update_fields=['raw_data', 'external_brand_id'],
+        )
+    except Exception as e:
+        logger.error(
+            '%s Error during bulk upsert of %s products for destination: %s (company: %s), pages: %s-%s. Error: %s.',
+            _LOG_PREFIX, len(product_instances), destination.id, company.name, page_range[0], page_range[1], str(e)
+        )
+        return 0
+
+    logger.info(
+        '%s Successfully upserted %s products for destination: %s (company: %s), pages: %s-%s.',
+        _LOG_PREFIX, len(product_instances), destination.id, company.name, page_range[0], page_range[1]
+    )
+    return len(product_instances)
 
 
 def _transform_products_data(
     products_data: typing.List[typing.Dict],
     destination: src_models.CompanyDestinations
-) -> typing.List[src_models.BigCommerceParts]:
-    product_instances = []
+) -> typing.Iterator[src_models.BigCommerceParts]:
+    # Bound once outside the per-product loop
+    bigcommerce_parts_model = src_models.BigCommerceParts
+    destination_id = destination.id
 
     for product_data in products_data:
         try:
-            external_id = str(product_data.get('id', ''))
-            sku = product_data.get('sku', '').strip()
+            get_product_value = product_data.get
+            external_id = str(get_product_value('id', ''))
+            sku = get_product_value('sku', '').strip()
 
             if not external_id:
-                logger.warning('{} Skipping product with missing external_id: {}'.format(
+                logger.warning(
+                    '%s Skipping product with missing external_id: %s',
                     _LOG_PREFIX, product_data
-                ))
+                )
                 continue
 
             if not sku:
                 sku = external_id
 
-            brand_id = product_data.get('brand_id')
+            brand_id = get_product_value('brand_id')
             external_brand_id = str(brand_id) if brand_id is not None else None
 
-            product_instance = src_models.BigCommerceParts(
+            yield bigcommerce_parts_model(
                 external_id=external_id,
                 sku=sku,
-                raw_data=product_data,
+                raw_data=_minimize_raw_data(product_data),
                 external_brand_id=external_brand_id,
-                company_destination=destination,
+                company_destination_id=destination_id,
             )
 
-            product_instances.append(product_instance)
-
         except Exception as e:
-            logger.warning('{} Error transforming product data {}: {}. Skipping.'.format(
+            logger.warning(
+                '%s Error transforming product data %s: %s. Skipping.',
                 _LOG_PREFIX, product_data, str(e)
-            ))
+            )
             continue
 
-    return product_instances
-
 
 def fetch_and_sync_all_ecommerce_parts_to_bigcommerce_destination() -> None:
     '''
@@ -331,16 +457,20 @@ def fetch_and_sync_all_ecommerce_parts_to_bigcommerce_destination() -> None:
 
     '''
     logger.info('{} Started fetching and syncing all ecommerce parts to bigcommerce destination.'.format(_LOG_PREFIX))
-    bigcommerce_active_destinations = src_models.CompanyDestinations.objects.filter(
-        destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value,
-        status=src_enums.IntegrationDestinationStatus.ACTIVE.value,
+    bigcommerce_active_destination_ids = list(
+        src_models.CompanyDestinations.objects.filter(
+            destination_type=src_enums.IntegrationDestinationType.BIGCOMMERCE.value,
+            status=src_enums.IntegrationDestinationStatus.ACTIVE.value,
+        ).values_list('id', flat=True)
     )
-    if not bigcommerce_active_destinations:
+    if not bigcommerce_active_destination_ids:
         logger.info('{} No active destinations found for bigcommerce destination.'.format(_LOG_PREFIX))
         return
 
-    company_brands_for_bigcommerce_destination = src_models.CompanyBrandDestination.objects.filter(
-        destination__in=bigcommerce_active_destinations,
+    company_brands_for_bigcommerce_destination = list(
+        src_models.CompanyBrandDestination.objects.filter(
+            destination_id__in=bigcommerce_active_destination_ids,
+        ).select_related('company_brand__company', 'company_brand__brand', 'destination')
     )
 
     if not company_brands_for_bigcommerce_destination:
@@ -358,6 +488,8 @@ def fetch_and_sync_all_ecommerce_parts_to_bigcommerce_destination() -> None:
                 _LOG_PREFIX, str(e)
             ))
 
+
+
 def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
     company_brand: src_models.CompanyBrandDestination
 ) -> None:
@@ -389,7 +521,7 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
             execution_run.status_name = src_enums.DestinationExecutionRunStatus.COMPLETED.name
             execution_run.message = message
             execution_run.completed_at = timezone.now()
-            execution_run.save()
+            execution_run.save(update_fields=_EXECUTION_RUN_FINISH_FIELDS)
             return
 
         logger.info(
@@ -407,7 +539,7 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
             execution_run.status_name = src_enums.DestinationExecutionRunStatus.COMPLETED.name
             execution_run.message = message
             execution_run.completed_at = timezone.now()
-            execution_run.save()
+            execution_run.save(update_fields=_EXECUTION_RUN_FINISH_FIELDS)
             return
 
         logger.info(
@@ -430,7 +562,7 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
             execution_run.error_message = error_msg
             execution_run.message = error_msg
             execution_run.completed_at = timezone.now()
-            execution_run.save()
+            execution_run.save(update_fields=_EXECUTION_RUN_FINISH_FIELDS)
             return
 
         products_to_update, products_to_create = _categorize_products_for_sync(
@@ -454,6 +586,17 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
             'lock': threading.Lock()
         }
 
+        # Category IDs resolved during this run, shared by all products
+        category_cache = {}
+        _prepare_bigcommerce_categories(
+            products_for_sync=products_for_sync,
+            destination=destination,
+            api_client=api_client,
+            category_cache=category_cache
+        )
+        # (name, parent_id) by BigCommerce category ID, for reading categories back off product responses
+        category_names_by_id = _load_category_names_by_id(destination)
+
         # Process updates and creates in parallel
         with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
             futures = []
@@ -469,7 +612,9 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
                     brand=brand,
                     api_client=api_client,
                     execution_run=execution_run,
-                    counters=counters
+                    counters=counters,
+                    category_cache=category_cache,
+                    category_names_by_id=category_names_by_id
                 )
                 futures.append(future)
             
@@ -483,7 +628,9 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
                     brand=brand,
                     api_client=api_client,
                     execution_run=execution_run,
-                    counters=counters
+                    counters=counters,
+                    category_cache=category_cache,
+                    category_names_by_id=category_names_by_id
                 )
                 futures.append(future)
             
@@ -513,7 +660,7 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
         execution_run.status_name = src_enums.DestinationExecutionRunStatus.COMPLETED.name
         execution_run.message = message
         execution_run.completed_at = timezone.now()
-        execution_run.save()
+        execution_run.save(update_fields=_EXECUTION_RUN_FINISH_FIELDS)
 
     except Exception as e:
         error_msg = 'Error during sync: {}'.format(str(e))
@@ -523,7 +670,7 @@ def fetch_and_sync_ecommerce_parts_for_company_brand_to_bigcommerce(
         execution_run.error_message = error_msg
         execution_run.message = error_msg
         execution_run.completed_at = timezone.now()
-        execution_run.save()
+        execution_run.save(update_fields=_EXECUTION_RUN_FINISH_FIELDS)
 
 
 def prepare_products_for_syncing_into_bigcommerce(
@@ -531,8 +678,10 @@ def prepare_products_for_syncing_into_bigcommerce(
         brand: src_models.Brands,
         destination: src_models.CompanyDestinations
 ) -> list[src_messages.BigCommercePart]:
-    brand_providers = src_models.BrandProviders.objects.filter(
-        brand=brand
+    brand_providers = list(
+        src_models.BrandProviders.objects.filter(
+            brand=brand
+        ).select_related('provider')
     )
     if not brand_providers:
         logger.error('{} No brand providers found for brand {}.'.format(
@@ -540,6 +689,15 @@ def prepare_products_for_syncing_into_bigcommerce(
         ))
         raise Exception('{} No brand providers found for brand {}.'.format(_LOG_PREFIX, brand.name))
 
+    # Resolved once here instead of once per provider kind. A missing mapping skips the brand rather than the run.
+    try:
+        bigcommerce_brand_id = _get_bigcommerce_brand_id(brand, destination)
+    except (src_models.BigCommerceBrands.DoesNotExist, src_models.BigCommerceBrands.MultipleObjectsReturned) as e:
+        logger.error('{} Could not resolve BigCommerce brand for brand {} (destination id={}). Error: {}.'.format(
+            _LOG_PREFIX, brand.name, destination.id, str(e)
+        ))
+        return []
+
     # Group providers by type (CATALOG vs DISTRIBUTOR)
     catalog_providers = []
     distributor_providers = []
@@ -553,14 +711,18 @@ def prepare_products_for_syncing_into_bigcommerce(
         elif provider_type == src_enums.BrandProvider.DISTRIBUTOR.name:
             distributor_providers.append(brand_provider)
     
-    # Prepare parts from all CATALOG providers (grouped by provider)
-    catalog_parts_by_provider = {}
-    for catalog_provider in catalog_providers:
+    # Only the first provider of each type is used (later we'll add logic to determine which provider to use),
+    # so parts are prepared and held in memory for that provider only
+
+    # Prepare parts from the first CATALOG provider
+    catalog_parts = {}
+    if catalog_providers:
+        catalog_provider = catalog_providers[0]
         try:
-            parts = _prepare_parts_by_kind(catalog_provider.provider.kind_name, brand, company)
-            # Store parts by provider, indexed by MPN (fallback to SKU if MPN is empty)
+            parts = _prepare_parts_by_kind(catalog_provider.provider.kind_name, brand, company, bigcommerce_brand_id)
+            # Index parts by MPN (fallback to SKU if MPN is empty)
             # For SDC: MPN = part_number, which is the same as SKU
-            catalog_parts_by_provider[catalog_provider] = {
+            catalog_parts = {
                 (part.mpn.strip() if part.mpn and part.mpn.strip() else part.sku): part 
                 for part in parts
             }
@@ -569,14 +731,15 @@ def prepare_products_for_syncing_into_bigcommerce(
                 _LOG_PREFIX, catalog_provider.provider.kind_name, brand, str(e)
             ))
     
-    # Prepare parts from all DISTRIBUTOR providers (grouped by provider)
-    distributor_parts_by_provider = {}
-    for distributor_provider in distributor_providers:
+    # Prepare parts from the first DISTRIBUTOR provider
+    distributor_parts = {}
+    if distributor_providers:
+        distributor_provider = distributor_providers[0]
         try:
-            parts = _prepare_parts_by_kind(distributor_provider.provider.kind_name, brand, company)
-            # Store parts by provider, indexed by MPN (fallback to SKU if MPN is empty)
+            parts = _prepare_parts_by_kind(distributor_provider.provider.kind_name, brand, company, bigcommerce_brand_id)
+            # Index parts by MPN (fallback to SKU if MPN is empty)
             # For Turn14: MPN = mfr_part_number, SKU = part_number (with brand prefix)
-            distributor_parts_by_provider[distributor_provider] = {
+            distributor_parts = {
                 (part.mpn.strip() if part.mpn and part.mpn.strip() else part.sku): part 
                 for part in parts
             }
@@ -585,18 +748,6 @@ def prepare_products_for_syncing_into_bigcommerce(
                 _LOG_PREFIX, distributor_provider.provider.kind_name, brand, str(e)
             ))
     
-    # Use parts from first catalog provider (later we'll add logic to determine which provider to use)
-    catalog_parts = {}
-    if catalog_parts_by_provider and catalog_providers:
-        first_catalog_provider = catalog_providers[0]
-        catalog_parts = catalog_parts_by_provider.get(first_catalog_provider, {})
-    
-    # Use parts from first distributor provider (later we'll add logic to determine which provider to use)
-    distributor_parts = {}
-    if distributor_parts_by_provider and distributor_providers:
-        first_distributor_provider = distributor_providers[0]
-        distributor_parts = distributor_parts_by_provider.get(first_distributor_provider, {})
-    
     # If no catalog parts, return distributor parts as-is
     if not catalog_parts:
         return list(distributor_parts.values())
@@ -626,27 +777,54 @@ def prepare_products_for_syncing_into_bigcommerce(
     return merged_parts
 
 
+def _get_bigcommerce_brand_id(
+    brand: src_models.Brands,
+    destination: typing.Optional[src_models.CompanyDestinations] = None,
+) -> int:
+    bigcommerce_brands = src_models.BigCommerceBrands.objects.only('external_id').filter(brand_id=brand.id)
+    if destination is not None:
+        bigcommerce_brands = bigcommerce_brands.filter(company_destination=destination)
+    return int(bigcommerce_brands.get().external_id)
+
+
 def _prepare_parts_by_kind(
     kind_name: str,
     brand: src_models.Brands,
     company: typing.Optional[src_models.Company] = None,
-) -> list[src_messages.BigCommercePart]:
+    bigcommerce_brand_id: typing.Optional[int] = None,
+) -> typing.Iterable[src_messages.BigCommercePart]:
     """
     Prepare parts based on provider kind_name.
     Routes to the appropriate preparation function.
     """
     if kind_name == src_enums.BrandProviderKind.SDC.name:
-        return prepare_sdc_products_for_bigcommerce(brand=brand)
+        return prepare_sdc_products_for_bigcommerce(brand=brand, bigcommerce_brand_id=bigcommerce_brand_id)
     elif kind_name == src_enums.BrandProviderKind.TURN_14.name:
         if company is None:
             logger.error('{} Turn 14 parts require company context for pricing.'.format(_LOG_PREFIX))
             return []
-        return prepare_turn_14_products_for_bigcommerce(brand=brand, company=company)
+        return prepare_turn_14_products_for_bigcommerce(
+            brand=brand, company=company, bigcommerce_brand_id=bigcommerce_brand_id
+        )
     else:
         logger.warning('{} Unknown provider kind: {}. Skipping.'.format(_LOG_PREFIX, kind_name))
         return []
 
 
+_BIGCOMMERCE_PART_FIELDS = tuple(field.name for field in dataclasses.fields(src_messages.BigCommercePart))
+
+# BigCommercePart fields split by which source wins (see BIGCOMMERCE_PART_FIELD_PRIORITY; default CATALOG).
+# custom_fields is combined from both sources instead.
+_MERGED_PART_FIELDS = tuple(field_name for field_name in _BIGCOMMERCE_PART_FIELDS if field_name != 'custom_fields')
+_CATALOG_FIRST_FIELDS = tuple(
+    field_name for field_name in _MERGED_PART_FIELDS
+    if src_constants.BIGCOMMERCE_PART_FIELD_PRIORITY.get(field_name, 'CATALOG') == 'CATALOG'
+)
+_DISTRIBUTOR_FIRST_FIELDS = tuple(
+    field_name for field_name in _MERGED_PART_FIELDS if field_name not in _CATALOG_FIRST_FIELDS
+)
+
+
 def _merge_catalog_and_distributor_parts(
     catalog_part: src_messages.BigCommercePart,
     distributor_part: typing.Optional[src_messages.BigCommercePart]
@@ -658,65 +836,49 @@ def _merge_catalog_and_distributor_parts(
     if not distributor_part:
         return catalog_part
     
-    # Get field priority configuration
-    field_priority = src_constants.BIGCOMMERCE_PART_FIELD_PRIORITY
-    
     # Build merged part field by field
     merged_fields = {}
-    
-    # Get all fields from BigCommercePart dataclass
-    for field_name in catalog_part.__dataclass_fields__.keys():
-        # Special handling for custom_fields - merge/combine from both sources
-        if field_name == 'custom_fields':
-            catalog_custom_fields = getattr(catalog_part, field_name, None) or []
-            distributor_custom_fields = getattr(distributor_part, field_name, None) or []
-            
-            # Combine custom fields from both sources
-            # Create a map by name to avoid duplicates
-            combined_custom_fields_map = {}
-            
-            # Add catalog custom fields first
-            if isinstance(catalog_custom_fields, list):
-                for field in catalog_custom_fields:
-                    if isinstance(field, dict):
-                        field_name_key = field.get('name', '').strip()
-                        if field_name_key:
-                            combined_custom_fields_map[field_name_key] = field
-            
-            # Add distributor custom fields (will overwrite catalog if same name)
-            if isinstance(distributor_custom_fields, list):
-                for field in distributor_custom_fields:
-                    if isinstance(field, dict):
-                        field_name_key = field.get('name', '').strip()
-                        if field_name_key:
-                            combined_custom_fields_map[field_name_key] = field
-            
-            merged_fields[field_name] = list(combined_custom_fields_map.values())
-            continue
-        
-        primary_source = field_priority.get(field_name, 'CATALOG')  # Default to CATALOG
-        
-        if primary_source == 'CATALOG':
-            # Try catalog first, fallback to distributor
-            catalog_value = getattr(catalog_part, field_name, None)
-            distributor_value = getattr(distributor_part, field_name, None)
-            
-            # Check if value is null/empty
-            if _is_value_empty(catalog_value):
-                merged_fields[field_name] = distributor_value
-            else:
-                merged_fields[field_name] = catalog_value
-        else:  # DISTRIBUTOR
-            # Try distributor first, fallback to catalog
-            distributor_value = getattr(distributor_part, field_name, None)
-            catalog_value = getattr(catalog_part, field_name, None)
-            
-            # Check if value is null/empty
-            if _is_value_empty(distributor_value):
-                merged_fields[field_name] = catalog_value
-            else:
-                merged_fields[field_name] = distributor_value
-    
+
+    # Special handling for custom_fields - merge/combine from both sources
+    catalog_custom_fields = catalog_part.custom_fields or []
+    distributor_custom_fields = distributor_part.custom_fields or []
+
+    # Combine custom fields from both sources
+    # Create a map by name to avoid duplicates
+    combined_custom_fields_map = {}
+
+    # Add catalog custom fields first
+    if isinstance(catalog_custom_fields, list):
+        for field in catalog_custom_fields:
+            if isinstance(field, dict):
+                field_name_key = field.get('name', '').strip()
+                if field_name_key:
+                    combined_custom_fields_map[field_name_key] = field
+
+    # Add distributor custom fields (will overwrite catalog if same name)
+    if isinstance(distributor_custom_fields, list):
+        for field in distributor_custom_fields:
+            if isinstance(field, dict):
+                field_name_key = field.get('name', '').strip()
+                if field_name_key:
+                    combined_custom_fields_map[field_name_key] = field
+
+    merged_fields['custom_fields'] = list(combined_custom_fields_map.values())
+
+    # Try catalog first, fallback to distributor
+    for field_name in _CATALOG_FIRST_FIELDS:
+        catalog_value = getattr(catalog_part, field_name)
+        merged_fields[field_name] = (
+            getattr(distributor_part, field_name) if _is_value_empty(catalog_value) else catalog_value
+        )
+
+    # Try distributor first, fallback to catalog
+    for field_name in _DISTRIBUTOR_FIRST_FIELDS:
+        distributor_value = getattr(distributor_part, field_name)
+        merged_fields[field_name] = (
+            getattr(catalog_part, field_name) if _is_value_empty(distributor_value) else distributor_value
+        )
+
     # Create merged BigCommercePart
     return src_messages.BigCommercePart(**merged_fields)
 
@@ -728,33 +890,63 @@ def _is_value_empty(value: typing.Any) -> bool:
     """
     if value is None:
         return True
-    if isinstance(value, str) and not value.strip():
-        return True
-    if isinstance(value, (list, dict)) and len(value) == 0:
-        return True
+    # Exact type checks cover the merged part fields; isinstance only runs for subclasses and other types
+    value_type = type(value)
+    if value_type is str:
+        return not value.strip()
+    if value_type is int or value_type is float or value_type is bool:
+        return False
+    if value_type is list or value_type is dict:
+        return not value
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, dict)):
+        return len(value) == 0
     return False
 
-def prepare_sdc_products_for_bigcommerce(brand: src_models.Brands) -> list[src_messages.BigCommercePart]:
+# SDCParts columns read while building BigCommerce parts; the rest are never selected
+_SDC_PART_FIELDS = (
+    'part_number', 'title', 'life_cycle_status', 'country_of_origin', 'warranty',
+    'long_description', 'extended_description', 'application_summary', 'features_and_benefits',
+    'marketing_description', 'product_attributes', 'jobber_usd', 'retail_usd', 'map_usd',
+    'primary_image', 'additional_image', 'installation_instructions', 'length_for_case',
+    'width_for_case', 'height_for_case', 'weight_for_case', 'inventory', 'quantity_per_application',
+)
+# "Associated Comments" isn't a column on SDCParts yet; resolve that once at import instead of
+# probing every row, and load it with the other part fields as soon as the model grows it
+_SDC_HAS_ASSOCIATED_COMMENTS = hasattr(src_models.SDCParts, 'associated_comments')
+if _SDC_HAS_ASSOCIATED_COMMENTS:
+    _SDC_PART_FIELDS += ('associated_comments',)
+_SDC_FITMENT_FIELDS = ('sku', 'year', 'make', 'model', 'category_pcdb', 'subcategory_pcdb')
+_SDC_ITERATOR_CHUNK_SIZE = 2000
+
+
+def prepare_sdc_products_for_bigcommerce(
+    brand: src_models.Brands,
+    bigcommerce_brand_id: typing.Optional[int] = None,
+) -> list[src_messages.BigCommercePart]:
     bigcommerce_parts = []
     sdc_brand = src_models.BrandSDCBrandMapping.objects.get(brand_id=brand.id)
     sdc_items = src_models.SDCParts.objects.filter(
-        brand_id=sdc_brand.sdc_brand.id
+        brand_id=sdc_brand.sdc_brand_id
     )
-    bigcommerce_brand = src_models.BigCommerceBrands.objects.get(brand_id=brand.id)
+    if bigcommerce_brand_id is None:
+        bigcommerce_brand_id = _get_bigcommerce_brand_id(brand)
 
     # Get fitments for all SDC items in bulk
-    all_part_numbers = [item.part_number for item in sdc_items]
     fitments_dict = {}
     for fitment in src_models.SDCPartFitment.objects.filter(
-        sku__in=all_part_numbers,
-        brand=sdc_brand.sdc_brand
-    ).order_by('year', 'make', 'model'):
+        sku__in=sdc_items.values('part_number'),
+        brand_id=sdc_brand.sdc_brand_id
+    ).order_by('year', 'make', 'model').values_list(*_SDC_FITMENT_FIELDS, named=True):
         # Store all fitments for each SKU as a list
         if fitment.sku not in fitments_dict:
             fitments_dict[fitment.sku] = []
         fitments_dict[fitment.sku].append(fitment)
 
-    for sdc_item in sdc_items:
+    # Named rows keep the helpers' attribute access without building SDCParts instances
+    sdc_rows = sdc_items.values_list(*_SDC_PART_FIELDS, named=True)
+    for sdc_item in sdc_rows.iterator(chunk_size=_SDC_ITERATOR_CHUNK_SIZE):
         default_price, cost, msrp = _get_sdc_prices(sdc_item)
         width, height, depth = _get_sdc_dimensions(sdc_item)
         weight = _get_sdc_weight(sdc_item)
@@ -789,7 +981,7 @@ def prepare_sdc_products_for_bigcommerce(brand: src_models.Brands) -> list[src_m
         
         bigcommerce_parts.append(
             src_messages.BigCommercePart(
-                brand_id=int(bigcommerce_brand.external_id),
+                brand_id=bigcommerce_brand_id,
                 product_title='{} - {}'.format(sdc_item.title or '', sdc_item.part_number),
                 sku=sdc_item.part_number,
                 mpn=sdc_item.part_number,
@@ -813,6 +1005,17 @@ def prepare_sdc_products_for_bigcommerce(brand: src_models.Brands) -> list[src_m
 
     return bigcommerce_parts
 
+def _to_float(value: typing.Any) -> typing.Optional[float]:
+    if value is None:
+        return None
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _get_sdc_prices(sdc_item: src_models.SDCParts) -> typing.Tuple[float, float, float]:
     """
     Extract prices from SDC part.
@@ -844,12 +1047,8 @@ def _get_sdc_prices(sdc_item: src_models.SDCParts) -> typing.Tuple[float, float,
 
 def _get_sdc_weight(sdc_item: src_models.SDCParts) -> float:
     """Get weight from SDC part. Weight is stored in weight_for_case in pounds."""
-    if sdc_item.weight_for_case is not None:
-        try:
-            return float(sdc_item.weight_for_case)
-        except (ValueError, TypeError):
-            pass
-    return 0.0
+    weight = _to_float(sdc_item.weight_for_case)
+    return weight if weight is not None else 0.0
 
 
 def _get_sdc_dimensions(sdc_item: src_models.SDCParts) -> typing.Tuple[typing.Optional[float], typing.Optional[float], typing.Optional[float]]:
@@ -857,29 +1056,21 @@ def _get_sdc_dimensions(sdc_item: src_models.SDCParts) -> typing.Tuple[typing.Op
     Extract width, height, and depth from SDC part.
     Returns: (width, height, depth)
     """
-    width = None
-    height = None
-    depth = None
-    
-    if sdc_item.width_for_case is not None:
-        try:
-            width = float(sdc_item.width_for_case)
-        except (ValueError, TypeError):
-            width = None
-    
-    if sdc_item.height_for_case is not None:
-        try:
-            height = float(sdc_item.height_for_case)
-        except (ValueError, TypeError):
-            height = None
-    
-    if sdc_item.length_for_case is not None:
-        try:
-            depth = float(sdc_item.length_for_case)
-        except (ValueError, TypeError):
-            depth = None
-    
-    return (width, height, depth)
+    return (
+        _to_float(sdc_item.width_for_case),
+        _to_float(sdc_item.height_for_case),
+        _to_float(sdc_item.length_for_case),
+    )
+
+
+# Section headings shared by the SDC and Turn 14 description builders
+_HTML_OVERVIEW_HEAD = '<p><strong>Overview:</strong></p>'
+_HTML_FEATURES_HEAD = '<p><strong>Features and Benefits:</strong></p>'
+_HTML_APPLICATION_SUMMARY_HEAD = '<p><strong>Application Summary:</strong></p>'
+_HTML_QUICK_SPECS_HEAD = '<p><strong>Quick Specs:</strong></p>'
+_HTML_ADDITIONAL_SPECS_HEAD = '<p><strong>Additional Specifications:</strong></p>'
+_HTML_IMPORTANT_NOTES_HEAD = '<p><strong>Important Notes:</strong></p>'
+_HTML_INSTRUCTIONS_HEAD = '<p><strong>Instructions:</strong></p>'
 
 
 def _get_sdc_description(sdc_item: src_models.SDCParts, fitments: typing.Optional[typing.List[src_models.SDCPartFitment]] = None) -> str:
@@ -891,37 +1082,28 @@ def _get_sdc_description(sdc_item: src_models.SDCParts, fitments: typing.Optiona
     html_parts = []
     
     # Add long description or marketing description as overview
-    overview_text = None
-    if sdc_item.marketing_description:
-        overview_text = sdc_item.marketing_description
-    elif sdc_item.extended_description:
-        overview_text = sdc_item.extended_description
-    elif sdc_item.long_description:
-        overview_text = sdc_item.long_description
+    overview_text = sdc_item.marketing_description or sdc_item.extended_description or sdc_item.long_description
     
     if overview_text:
-        html_parts.append('<p><strong>Overview:</strong></p>')
-        html_parts.append('<p>{}</p>'.format(overview_text))
+        html_parts.append(_HTML_OVERVIEW_HEAD)
+        html_parts.append(f'<p>{_escape_html_text(overview_text)}</p>')
     
     # Add extended description if different from overview
     if sdc_item.extended_description and sdc_item.extended_description != overview_text:
-        html_parts.append('<p>{}</p>'.format(sdc_item.extended_description))
+        html_parts.append(f'<p>{_escape_html_text(sdc_item.extended_description)}</p>')
     
     # Add features and benefits - split by semicolons and format as list
     if sdc_item.features_and_benefits:
-        html_parts.append('<p><strong>Features and Benefits:</strong></p>')
+        html_parts.append(_HTML_FEATURES_HEAD)
         # Split by semicolon and strip whitespace from each item
-        features_list = [feature.strip() for feature in sdc_item.features_and_benefits.split(';') if feature.strip()]
+        features_list = _split_list_items(sdc_item.features_and_benefits)
         if features_list:
-            html_parts.append('<ul>')
-            for feature in features_list:
-                html_parts.append('<li>{}</li>'.format(feature))
-            html_parts.append('</ul>')
+            html_parts.append('<ul><li>' + '</li><li>'.join(features_list) + '</li></ul>')
     
     # Add application summary if available
     if sdc_item.application_summary:
-        html_parts.append('<p><strong>Application Summary:</strong></p>')
-        html_parts.append('<p>{}</p>'.format(sdc_item.application_summary))
+        html_parts.append(_HTML_APPLICATION_SUMMARY_HEAD)
+        html_parts.append(f'<p>{_escape_html_text(sdc_item.application_summary)}</p>')
     
     # Add Quick Specs section if available
     quick_specs = _get_sdc_quick_specs(sdc_item)
@@ -931,14 +1113,14 @@ def _get_sdc_description(sdc_item: src_models.SDCParts, fitments: typing.Optiona
     # Add Important Notes section if available
     important_notes = _get_sdc_important_notes(sdc_item)
     if important_notes:
-        html_parts.append('<p><strong>Important Notes:</strong></p>')
+        html_parts.append(_HTML_IMPORTANT_NOTES_HEAD)
         html_parts.append(important_notes)
     
     # Add Instructions section if available
     instruction_link = _get_sdc_instruction_link(sdc_item)
     if instruction_link:
-        html_parts.append('<p><strong>Instructions:</strong></p>')
-        html_parts.append('<p>{}</p>'.format(instruction_link))
+        html_parts.append(_HTML_INSTRUCTIONS_HEAD)
+        html_parts.append(f'<p>{instruction_link}</p>')
     
     # Add fitment table at the end if fitments are provided
     if fitments:
@@ -960,14 +1142,11 @@ def _get_sdc_quick_specs(sdc_item: src_models.SDCParts) -> typing.Optional[str]:
     if sdc_item.product_attributes:
         # Split by semicolon and format as key: value pairs
         attributes_list = []
-        for attribute in sdc_item.product_attributes.split(';'):
-            attribute = attribute.strip()
-            if not attribute:
-                continue
+        for attribute in _split_list_items(sdc_item.product_attributes):
             # Split by colon to separate key and value
-            if ':' in attribute:
-                parts = attribute.split(':', 1)
-                formatted = ': '.join([part.strip() for part in parts])
+            key, separator, value = attribute.partition(':')
+            if separator:
+                formatted = f'{key.strip()}: {value.strip()}'
             else:
                 formatted = attribute
             attributes_list.append(formatted)
@@ -975,20 +1154,20 @@ def _get_sdc_quick_specs(sdc_item: src_models.SDCParts) -> typing.Optional[str]:
         if attributes_list:
             specs.append('<ul><li>' + '</li><li>'.join(attributes_list) + '</li></ul>')
     
-    # Section 2: Additional Fields
+    # Section 2: Additional Fields (collected without tags, wrapped as one list below)
     additional_specs = []
     
     # Quantity per Application
     if sdc_item.quantity_per_application:
-        additional_specs.append('<li>Quantity per Application: {}</li>'.format(sdc_item.quantity_per_application))
+        additional_specs.append(f'Quantity per Application: {_escape_html_text(sdc_item.quantity_per_application)}')
     
     # Country of Origin
     if sdc_item.country_of_origin:
-        additional_specs.append('<li>Country of Origin: {}</li>'.format(sdc_item.country_of_origin))
+        additional_specs.append(f'Country of Origin: {_escape_html_text(sdc_item.country_of_origin)}')
     
     # Warranty
     if sdc_item.warranty:
-        additional_specs.append('<li>Warranty: {}</li>'.format(sdc_item.warranty))
+        additional_specs.append(f'Warranty: {_escape_html_text(sdc_item.warranty)}')
     
     # Dimensions (Length x Width x Height)
     dimensions_parts = []
@@ -1000,29 +1179,42 @@ def _get_sdc_quick_specs(sdc_item: src_models.SDCParts) -> typing.Optional[str]:
         dimensions_parts.append(str(sdc_item.height_for_case))
     
     if dimensions_parts:
-        dimensions_str = ' x '.join(dimensions_parts)
-        additional_specs.append('<li>Length (EA) x Width (EA) x Height (EA): {}</li>'.format(dimensions_str))
+        additional_specs.append(f"Length (EA) x Width (EA) x Height (EA): {' x '.join(dimensions_parts)}")
     
     # Weight
     if sdc_item.weight_for_case is not None:
-        additional_specs.append('<li>Weight (lbs): {}</li>'.format(sdc_item.weight_for_case))
+        additional_specs.append(f'Weight (lbs): {sdc_item.weight_for_case}')
     
     # Vehicle Specific Fitment - we'll need to query fitments separately
     # For now, we'll skip this as it requires additional query
     
     # Add the additional fields to the specs if not empty
     if additional_specs:
-        specs.append('<p><strong>Additional Specifications:</strong></p>')
-        specs.append('<ul>' + ''.join(additional_specs) + '</ul>')
+        specs.append(_HTML_ADDITIONAL_SPECS_HEAD)
+        specs.append('<ul><li>' + '</li><li>'.join(additional_specs) + '</li></ul>')
     
     # Only return content if there are actual specs, and add title at the beginning
     if specs:
-        specs.insert(0, '<p><strong>Quick Specs:</strong></p>')
+        specs.insert(0, _HTML_QUICK_SPECS_HEAD)
         return ''.join(specs)
     
     return None
 
 
+def _escape_html_text(value: typing.Any) -> str:
+    """Escape a DB-sourced value for use as text inside description HTML."""
+    return html.escape(str(value), quote=False)
+
+
+def _html_link(url: str, label: str) -> str:
+    return f'<a href="{html.escape(url)}" target="_blank">{_escape_html_text(label)}</a>'
+
+
+def _split_list_items(field_value: str, separator: str = ';') -> typing.List[str]:
+    """Split a delimited SDC text field into stripped, non-empty, HTML-escaped list items."""
+    return [_escape_html_text(item) for raw_item in field_value.split(separator) if (item := raw_item.strip())]
+
+
 def _format_to_list(field_value: typing.Optional[str]) -> typing.Optional[str]:
     """
     Format field value as an HTML list.
@@ -1037,7 +1229,7 @@ def _format_to_list(field_value: typing.Optional[str]) -> typing.Optional[str]:
         return None
     
     # Split by semicolon and strip whitespace from each item
-    items = [item.strip() for item in field_value.split(';') if item.strip()]
+    items = _split_list_items(field_value)
     
     if not items:
         return None
@@ -1051,10 +1243,9 @@ def _get_sdc_important_notes(sdc_item: src_models.SDCParts) -> typing.Optional[s
     Get important notes from SDC part (Associated Comments).
     Returns formatted HTML list or None if not available.
     """
-    # Note: "Associated Comments" field may need to be added to SDCParts model
-    # For now, checking if there's a similar field or making it flexible
-    associated_comments = getattr(sdc_item, 'associated_comments', None) or ''
-    return _format_to_list(associated_comments)
+    if not _SDC_HAS_ASSOCIATED_COMMENTS:
+        return None
+    return _format_to_list(sdc_item.associated_comments)
 
 
 def _get_sdc_instruction_link(sdc_item: src_models.SDCParts) -> typing.Optional[str]:
@@ -1069,14 +1260,13 @@ def _get_sdc_instruction_link(sdc_item: src_models.SDCParts) -> typing.Optional[
     
     instruction_link = instruction_link.strip()
     
-    # Check if it contains a URL
-    if 'https' not in instruction_link:
+    # Check if it is a URL
+    if not instruction_link.startswith(('http://', 'https://')):
         return None
     
     # Extract filename from URL or use a default
     # Try to get filename from the URL path
     try:
-        from urllib.parse import urlparse
         parsed_url = urlparse(instruction_link)
         filename = parsed_url.path.split('/')[-1] if parsed_url.path else 'Installation Instructions'
         # If filename is empty or just a slash, use default
@@ -1085,60 +1275,71 @@ def _get_sdc_instruction_link(sdc_item: src_models.SDCParts) -> typing.Optional[
     except Exception:
         filename = 'Installation Instructions'
     
-    return '<a href="{}" target="_blank">{}</a>'.format(instruction_link, filename)
+    return _html_link(instruction_link, filename)
+
+
+# Valid SDC image extensions (case-sensitive)
+_SDC_VALID_IMAGE_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg', '.PNG', '.JPG', '.JPEG', '.GIF', '.WEBP', '.BMP', '.SVG',
+})
+
+
+def _encode_image_url(url: str) -> str:
+    """URL encode the image URL, preserving the URL structure."""
+    if not url:
+        return url
+    try:
+        # Parse the URL
+        parsed = urlparse(url)
+        # Encode the path component
+        encoded_path = '/'.join(quote(segment, safe='') for segment in parsed.path.split('/'))
+        # Nothing needed quoting, so the URL is returned as-is
+        if encoded_path == parsed.path:
+            return url
+        # Reconstruct the URL with encoded path
+        encoded_url = urlunparse((
+            parsed.scheme,
+            parsed.netloc,
+            encoded_path,
+            parsed.params,
+            parsed.query,
+            parsed.fragment
+        ))
+        return encoded_url
+    except Exception:
+        # If encoding fails, return original URL
+        return url
+
+
+def _is_valid_sdc_image_url(url: str) -> bool:
+    """Check if URL is a valid HTTP/HTTPS URL with a valid image extension (case-sensitive)."""
+    if not url:
+        return False
+
+    # Check if URL starts with http:// or https://
+    url_lower = url.strip().lower()
+    if not url_lower.startswith(('http://', 'https://')):
+        return False
+
+    # Extract extension from URL (handle query parameters)
+    url_path = urlparse(url).path
+    if '.' in url_path:
+        file_extension = '.' + url_path.rsplit('.', 1)[-1]
+        return file_extension in _SDC_VALID_IMAGE_EXTENSIONS
+    return False
 
 
 def _get_sdc_images(sdc_item: src_models.SDCParts) -> list:
     """Get images from SDC part. Returns list of image dicts with is_thumbnail and image_url."""
+    if not sdc_item.primary_image and not sdc_item.additional_image:
+        return []
+
     images = []
     
-    # Valid image extensions (case-sensitive)
-    valid_image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg', '.PNG', '.JPG', '.JPEG', '.GIF', '.WEBP', '.BMP', '.SVG'}
-    
-    def _encode_image_url(url: str) -> str:
-        """URL encode the image URL, preserving the URL structure."""
-        if not url:
-            return url
-        try:
-            # Parse the URL
-            parsed = urlparse(url)
-            # Encode the path component
-            encoded_path = '/'.join(quote(segment, safe='') for segment in parsed.path.split('/'))
-            # Reconstruct the URL with encoded path
-            encoded_url = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                encoded_path,
-                parsed.params,
-                parsed.query,
-                parsed.fragment
-            ))
-            return encoded_url
-        except Exception:
-            # If encoding fails, return original URL
-            return url
-    
-    def _is_valid_image_url(url: str) -> bool:
-        """Check if URL is a valid HTTP/HTTPS URL with a valid image extension (case-sensitive)."""
-        if not url:
-            return False
-        
-        # Check if URL starts with http:// or https://
-        url_lower = url.strip().lower()
-        if not (url_lower.startswith('http://') or url_lower.startswith('https://')):
-            return False
-        
-        # Extract extension from URL (handle query parameters)
-        url_path = urlparse(url).path
-        if '.' in url_path:
-            file_extension = '.' + url_path.rsplit('.', 1)[-1]
-            return file_extension in valid_image_extensions
-        return False
-    
     # Primary image is the thumbnail
     if sdc_item.primary_image:
-        if _is_valid_image_url(sdc_item.primary_image):
-            encoded_url = _encode_image_url(sdc_item.primary_image)
+        if _is_valid_sdc_image_url(sdc_item.primary_image):
+            encoded_url = _encode_image_url(sdc_item.primary_image.strip())
             images.append({
                 'is_thumbnail': True,
                 'image_url': encoded_url,
@@ -1151,8 +1352,8 @@ def _get_sdc_images(sdc_item: src_models.SDCParts) -> list:
     
     # Additional images
     if sdc_item.additional_image:
-        if _is_valid_image_url(sdc_item.additional_image):
-            encoded_url = _encode_image_url(sdc_item.additional_image)
+        if _is_valid_sdc_image_url(sdc_item.additional_image):
+            encoded_url = _encode_image_url(sdc_item.additional_image.strip())
             images.append({
                 'is_thumbnail': False,
                 'image_url': encoded_url,
@@ -1192,9 +1393,9 @@ def _get_sdc_fitment_table(fitments: typing.List[src_models.SDCPartFitment]) ->
     
     for fitment in fitments:
         html_parts.append('<tr>')
-        html_parts.append('<td style="text-align: center;">{}</td>'.format(fitment.year))
-        html_parts.append('<td style="text-align: center;">{}</td>'.format(fitment.make))
-        html_parts.append('<td style="text-align: center;">{}</td>'.format(fitment.model))
+        html_parts.append('<td style="text-align: center;">{}</td>'.format(_escape_html_text(fitment.year)))
+        html_parts.append('<td style="text-align: center;">{}</td>'.format(_escape_html_text(fitment.make)))
+        html_parts.append('<td style="text-align: center;">{}</td>'.format(_escape_html_text(fitment.model)))
         html_parts.append('</tr>')
     
     html_parts.append('</tbody>')
@@ -1245,35 +1446,57 @@ def _map_turn14_to_pcdb_category(
     return (turn14_category, turn14_subcategory)
 
 
+# Turn 14 columns read while building BigCommerce parts; the rest are never loaded
+_TURN_14_ITEM_FIELDS = (
+    'external_id', 'part_number', 'mfr_part_number', 'part_description', 'category', 'subcategory',
+    'active', 'thumbnail', 'dimensions',
+)
+_TURN_14_DATA_FIELDS = ('external_id', 'descriptions', 'files')
+_TURN_14_PRICING_FIELDS = ('external_id', 'pricelists', 'purchase_cost')
+_TURN_14_INVENTORY_FIELDS = ('external_id', 'inventory', 'total_inventory')
+_TURN_14_ITERATOR_CHUNK_SIZE = 2000
+
+
 def prepare_turn_14_products_for_bigcommerce(
     brand: src_models.Brands,
     company: src_models.Company,
-) -> list[src_messages.BigCommercePart]:
-    bigcommerce_parts = []
+    bigcommerce_brand_id: typing.Optional[int] = None,
+) -> typing.Iterator[src_messages.BigCommercePart]:
+    """
+    Yield BigCommerce parts for the brand's Turn 14 items one at a time, so callers indexing the
+    parts don't also hold a full intermediate list.
+    """
     turn_14_brand = src_models.BrandTurn14BrandMapping.objects.get(brand_id=brand.id)
     turn_14_items = src_models.Turn14Items.objects.filter(
         brand_id=turn_14_brand.turn14_brand_id
     )
 
-    if not turn_14_items:
+    if not turn_14_items.exists():
         logger.info('{} No turn 14 items found for brand {}.'.format(_LOG_PREFIX, brand.name))
-        return []
+        return
 
-    bigcommerce_brand = src_models.BigCommerceBrands.objects.get(brand_id=brand.id)
+    if bigcommerce_brand_id is None:
+        bigcommerce_brand_id = _get_bigcommerce_brand_id(brand)
     turn_14_item_data = {
-        item_data.external_id: item_data for item_data in src_models.Turn14BrandData.objects.filter(brand_id=turn_14_brand.turn14_brand_id)
+        item_data.external_id: item_data
+        for item_data in src_models.Turn14BrandData.objects.filter(
+            brand_id=turn_14_brand.turn14_brand_id
+        ).only(*_TURN_14_DATA_FIELDS)
     }
     turn_14_item_pricing = {
         item_data.external_id: item_data
         for item_data in src_models.Turn14BrandPricing.objects.filter(
             brand_id=turn_14_brand.turn14_brand_id,
             company_id=company.id,
-        )
+        ).only(*_TURN_14_PRICING_FIELDS)
     }
     turn_14_item_inventory = {
-        item_data.external_id: item_data for item_data in src_models.Turn14BrandInventory.objects.filter(brand_id=turn_14_brand.turn14_brand_id)
+        item_data.external_id: item_data
+        for item_data in src_models.Turn14BrandInventory.objects.filter(
+            brand_id=turn_14_brand.turn14_brand_id
+        ).only(*_TURN_14_INVENTORY_FIELDS)
     }
-    for turn_14_item in turn_14_items:
+    for turn_14_item in turn_14_items.only(*_TURN_14_ITEM_FIELDS).iterator(chunk_size=_TURN_14_ITERATOR_CHUNK_SIZE):
         turn_14_pricing = turn_14_item_pricing.get(turn_14_item.external_id, None)
         if not turn_14_pricing:
             logger.info('{} No pricing found for item {}. Skipping'.format(_LOG_PREFIX, turn_14_item.external_id))
@@ -1292,7 +1515,7 @@ def prepare_turn_14_products_for_bigcommerce(
 
         default_price, msrp = _get_turn_14_prices(turn_14_pricing)
         cost = _get_turn_14_cost(turn_14_pricing)
-        width, height, depth = _get_turn_14_dimensions(turn_14_item=turn_14_item)
+        weight, width, height, depth = _get_turn_14_physical_dimensions(turn_14_item=turn_14_item)
         
         # Map Turn14 categories to PCDB categories
         pcdb_category, pcdb_subcategory = _map_turn14_to_pcdb_category(
@@ -1300,31 +1523,27 @@ def prepare_turn_14_products_for_bigcommerce(
             turn14_subcategory=turn_14_item.subcategory
         )
         
-        bigcommerce_parts.append(
-            src_messages.BigCommercePart(
-                brand_id=int(bigcommerce_brand.external_id),
-                product_title='{} - {}'.format(turn_14_item.part_description, turn_14_item.part_number),
-                sku=turn_14_item.part_number,
-                mpn=turn_14_item.mfr_part_number,
-                default_price=default_price,
-                cost=cost,
-                msrp=msrp,
-                weight=_get_turn_14_weight(turn_14_item=turn_14_item),
-                width=width,
-                height=height,
-                depth=depth,
-                description=_get_turn_14_description(turn_14_data=turn_14_data),
-                images=_get_turn_14_images(turn_14_item=turn_14_item, turn_14_data=turn_14_data),
-                inventory=_get_turn_14_inventory(turn_14_inventory=turn_14_inventory),
-                custom_fields=[],
-                active=turn_14_item.active,
-                category=pcdb_category,
-                subcategory=pcdb_subcategory,
-            )
+        yield src_messages.BigCommercePart(
+            brand_id=bigcommerce_brand_id,
+            product_title='{} - {}'.format(turn_14_item.part_description, turn_14_item.part_number),
+            sku=turn_14_item.part_number,
+            mpn=turn_14_item.mfr_part_number,
+            default_price=default_price,
+            cost=cost,
+            msrp=msrp,
+            weight=weight,
+            width=width,
+            height=height,
+            depth=depth,
+            description=_get_turn_14_description(turn_14_data=turn_14_data),
+            images=_get_turn_14_images(turn_14_item=turn_14_item, turn_14_data=turn_14_data),
+            inventory=_get_turn_14_inventory(turn_14_inventory=turn_14_inventory),
+            custom_fields=[],
+            active=turn_14_item.active,
+            category=pcdb_category,
+            subcategory=pcdb_subcategory,
         )
 
-    return bigcommerce_parts
-
 
 def _get_turn_14_prices(
     turn_14_pricing: src_models.Turn14BrandPricing,
@@ -1336,35 +1555,20 @@ def _get_turn_14_prices(
     if not turn_14_pricing.pricelists:
         return default_price, msrp
 
-    map_price = None
-    retail_price = None
-    msrp_price = None
-    jobber_price = None
-
+    # Index valid prices by pricelist name (last valid entry wins)
+    prices = {}
     for pricelist_item in turn_14_pricing.pricelists:
         if not isinstance(pricelist_item, dict):
             continue
 
-        pricelist_name = pricelist_item.get("name")
-        price_value = pricelist_item.get("price")
+        price_float = _to_float(pricelist_item.get("price"))
+        if price_float is not None:
+            prices[pricelist_item.get("name")] = price_float
 
-        if price_value is None:
-            continue
-
-        try:
-            price_float = float(price_value)
-
-            if pricelist_name == "MAP":
-                map_price = price_float
-            elif pricelist_name == "Retail":
-                retail_price = price_float
-            elif pricelist_name == "MSRP":
-                msrp_price = price_float
-            elif pricelist_name == "Jobber":
-                jobber_price = price_float
-
-        except (ValueError, TypeError):
-            continue
+    map_price = prices.get("MAP")
+    retail_price = prices.get("Retail")
+    msrp_price = prices.get("MSRP")
+    jobber_price = prices.get("Jobber")
 
     # --- DEFAULT PRICE (what you show publicly) ---
     if map_price is not None:
@@ -1392,63 +1596,45 @@ def _get_turn_14_prices(
 
 
 def _get_turn_14_cost(turn_14_pricing: src_models.Turn14BrandPricing) -> float:
-    if turn_14_pricing.purchase_cost is not None:
-        try:
-            return float(turn_14_pricing.purchase_cost)
-        except (ValueError, TypeError):
-            pass
-    return 0.0
-
-def _get_turn_14_weight(turn_14_item: src_models.Turn14Items) -> float:
-    weight = 0.0
-
-    if not turn_14_item.dimensions:
-        return weight
+    cost = _to_float(turn_14_pricing.purchase_cost)
+    return cost if cost is not None else 0.0
 
-    weight_in_lbs = turn_14_item.dimensions[0].get('weight', 0)
+# Turn 14 reports box weight in pounds; BigCommerce products are stored in ounces
+_LB_TO_OZ = 16
 
-    return weight_in_lbs * 16
 
-def _get_turn_14_dimensions(turn_14_item: src_models.Turn14Items) -> typing.Tuple[typing.Optional[float], typing.Optional[float], typing.Optional[float]]:
+def _get_turn_14_physical_dimensions(
+    turn_14_item: src_models.Turn14Items,
+) -> typing.Tuple[float, typing.Optional[float], typing.Optional[float], typing.Optional[float]]:
     """
-    Extract width, height, and depth (length) from dimensions array.
-    Looks for box_number=1, if not found returns None for all.
-    Returns: (width, height, depth)
+    Extract weight (oz) and width, height, depth (length) from the dimensions array in one pass.
+    Weight comes from the first box; width/height/depth from box_number=1, or None if there isn't one.
+    Returns: (weight, width, height, depth)
     """
-    if not turn_14_item.dimensions or not isinstance(turn_14_item.dimensions, list):
-        return (None, None, None)
-    
-    # Find dimension with box_number=1
-    dimension_with_box_1 = None
-    for dim in turn_14_item.dimensions:
-        if isinstance(dim, dict) and dim.get('box_number') == 1:
-            dimension_with_box_1 = dim
-            break
-    
+    dimensions = turn_14_item.dimensions
+    if not dimensions or not isinstance(dimensions, list):
+        return 0.0, None, None, None
+
+    first_box = dimensions[0]
+    weight_in_lbs = _to_float(first_box.get('weight')) if isinstance(first_box, dict) else None
+    weight = weight_in_lbs * _LB_TO_OZ if weight_in_lbs is not None else 0.0
+
+    # Find dimension with box_number=1 (usually the first box as well)
+    dimension_with_box_1 = next(
+        (dim for dim in dimensions if isinstance(dim, dict) and dim.get('box_number') == 1),
+        None
+    )
+
     if not dimension_with_box_1:
-        return (None, None, None)
-    
-    width = dimension_with_box_1.get('width')
-    height = dimension_with_box_1.get('height')
-    length = dimension_with_box_1.get('length')  # length is depth in BigCommerce
-    
-    # Convert to float if they exist, otherwise None
-    try:
-        width = float(width) if width is not None else None
-    except (ValueError, TypeError):
-        width = None
-    
-    try:
-        height = float(height) if height is not None else None
-    except (ValueError, TypeError):
-        height = None
-    
-    try:
-        depth = float(length) if length is not None else None
-    except (ValueError, TypeError):
-        depth = None
-    
-    return (width, height, depth)
+        return weight, None, None, None
+
+    # Convert to float if they exist, otherwise None; length is depth in BigCommerce
+    return (
+        weight,
+        _to_float(dimension_with_box_1.get('width')),
+        _to_float(dimension_with_box_1.get('height')),
+        _to_float(dimension_with_box_1.get('length')),
+    )
 
 def _get_turn_14_instruction_link(turn_14_data: src_models.Turn14BrandData) -> typing.Optional[str]:
     """
@@ -1486,7 +1672,7 @@ def _get_turn_14_instruction_link(turn_14_data: src_models.Turn14BrandData) -> t
                 if not instruction_url:
                     continue
                 
-                return '<a href="{}" target="_blank">Installation Instructions</a>'.format(instruction_url)
+                return _html_link(instruction_url, 'Installation Instructions')
     
     return None
 
@@ -1521,7 +1707,7 @@ def _get_turn_14_owners_manual_link(turn_14_data: src_models.Turn14BrandData) ->
             if not owners_manual_url:
                 continue
             
-            return '<a href="{}" target="_blank">Owner\'s Manual</a>'.format(owners_manual_url)
+            return _html_link(owners_manual_url, "Owner's Manual")
     
     return None
 
@@ -1556,7 +1742,7 @@ def _get_turn_14_warranty_link(turn_14_data: src_models.Turn14BrandData) -> typi
             if not warranty_url:
                 continue
             
-            return '<a href="{}" target="_blank">Warranty</a>'.format(warranty_url)
+            return _html_link(warranty_url, 'Warranty')
     
     return None
 
@@ -1608,18 +1794,15 @@ def _get_turn_14_description(turn_14_data: src_models.Turn14BrandData) -> str:
     # ✅ Overview: Market Description wins, otherwise Extended
     overview_text = market_description or extended_description
     if overview_text:
-        html_parts.append(
-            '<p><strong>Overview:</strong></p>'
-            f'<p>{overview_text}</p>'
-        )
+        html_parts.append(_HTML_OVERVIEW_HEAD)
+        html_parts.append(f'<p>{_escape_html_text(overview_text)}</p>')
 
     # Features & Benefits
     if features_and_benefits:
-        features_html = '<p><strong>Features and Benefits:</strong></p><ul>'
-        for feature_text in features_and_benefits:
-            features_html += f'<li>{feature_text}</li>'
-        features_html += '</ul>'
-        html_parts.append(features_html)
+        html_parts.append(_HTML_FEATURES_HEAD)
+        html_parts.append('<ul>')
+        html_parts.extend(f'<li>{_escape_html_text(feature_text)}</li>' for feature_text in features_and_benefits)
+        html_parts.append('</ul>')
 
     # Important Notes (Associated Comments)
     if associated_comments:
@@ -1639,16 +1822,15 @@ def _get_turn_14_description(turn_14_data: src_models.Turn14BrandData) -> str:
                 important_notes_items.append(comment)
 
         if important_notes_items:
-            notes_html = '<p><strong>Important Notes:</strong></p><ul>'
-            for note in important_notes_items:
-                notes_html += f'<li>{note}</li>'
-            notes_html += '</ul>'
-            html_parts.append(notes_html)
+            html_parts.append(_HTML_IMPORTANT_NOTES_HEAD)
+            html_parts.append('<ul>')
+            html_parts.extend(f'<li>{_escape_html_text(note)}</li>' for note in important_notes_items)
+            html_parts.append('</ul>')
 
     # Instructions
     instruction_link = _get_turn_14_instruction_link(turn_14_data)
     if instruction_link:
-        html_parts.append('<p><strong>Instructions:</strong></p>')
+        html_parts.append(_HTML_INSTRUCTIONS_HEAD)
         html_parts.append(f'<p>{instruction_link}</p>')
 
     # Owner's Manual
@@ -1699,7 +1881,7 @@ def _get_turn_14_images(turn_14_item: src_models.Turn14Items, turn_14_data: src_
                 continue
 
             media_content = file.get('media_content', '')
-            image_url = file.get('links', [])[0].get('url', '')
+            image_url = file.get('links', [])[0].get('url', '').strip()
             
             if not image_url:
                 continue
@@ -1801,26 +1983,29 @@ def _categorize_products_for_sync(
     # Extract all SKUs for bulk querying
     all_skus = [product_to_sync.sku for product_to_sync in products_for_sync]
 
-    # Bulk fetch all BigCommerceParts in one query
-    bigcommerce_parts_dict = {
-        part.sku: part
+    # Bulk fetch BigCommerceParts / CompanyDestinationParts in SKU chunks so the IN lists stay
+    # small enough for Postgres to plan against the (company_destination, sku) indexes
+    # raw_data / source_data are only ever overwritten on update, so they aren't loaded
+    bigcommerce_parts_dict = {}
+    company_destination_parts_dict = {}
+    for start in range(0, len(all_skus), _SKU_LOOKUP_CHUNK_SIZE):
+        sku_chunk = all_skus[start:start + _SKU_LOOKUP_CHUNK_SIZE]
+
         for part in src_models.BigCommerceParts.objects.filter(
-            sku__in=all_skus,
+            sku__in=sku_chunk,
             company_destination=destination
-        )
-    }
+        ).defer('raw_data'):
+            bigcommerce_parts_dict[part.sku] = part
 
-    # Bulk fetch all CompanyDestinationParts in one query
-    # Note: Using first() behavior - if multiple exist, we take the first one
-    company_destination_parts_dict = {}
-    for part in src_models.CompanyDestinationParts.objects.filter(
-        part_unique_key__in=all_skus,
-        company_destination=destination,
-        brand=brand
-    ):
-        # Only keep the first occurrence of each SKU (matching original .first() behavior)
-        if part.part_unique_key not in company_destination_parts_dict:
-            company_destination_parts_dict[part.part_unique_key] = part
+        # Note: Using first() behavior - if multiple exist, we take the first one
+        for part in src_models.CompanyDestinationParts.objects.filter(
+            part_unique_key__in=sku_chunk,
+            company_destination=destination,
+            brand=brand
+        ).select_related('brand', 'company_destination').defer('source_data').order_by('id'):
+            # Only keep the first occurrence of each SKU (matching original .first() behavior)
+            if part.part_unique_key not in company_destination_parts_dict:
+                company_destination_parts_dict[part.part_unique_key] = part
 
     # Categorize products using the pre-fetched dictionaries
     for product_to_sync in products_for_sync:
@@ -1891,7 +2076,9 @@ def _process_product_update_with_retry(
     brand: src_models.Brands,
     api_client: bigcommerce_client.BigCommerceApiClient,
     execution_run: src_models.CompanyDestinationExecutionRun,
-    counters: typing.Dict
+    counters: typing.Dict,
+    category_cache: typing.Optional[typing.Dict] = None,
+    category_names_by_id: typing.Optional[typing.Dict] = None
 ) -> bool:
     """
     Process product update with retry logic and thread-safe counter updates.
@@ -1911,7 +2098,9 @@ def _process_product_update_with_retry(
                 destination=destination,
                 brand=brand,
                 api_client=api_client,
-                execution_run=execution_run
+                execution_run=execution_run,
+                category_cache=category_cache,
+                category_names_by_id=category_names_by_id
             )
             
             # Update counters thread-safely
@@ -1969,7 +2158,9 @@ def _process_product_create_with_retry(
     brand: src_models.Brands,
     api_client: bigcommerce_client.BigCommerceApiClient,
     execution_run: src_models.CompanyDestinationExecutionRun,
-    counters: typing.Dict
+    counters: typing.Dict,
+    category_cache: typing.Optional[typing.Dict] = None,
+    category_names_by_id: typing.Optional[typing.Dict] = None
 ) -> bool:
     """
     Process product create with retry logic and thread-safe counter updates.
@@ -1988,7 +2179,9 @@ def _process_product_create_with_retry(
                 destination=destination,
                 brand=brand,
                 api_client=api_client,
-                execution_run=execution_run
+                execution_run=execution_run,
+                category_cache=category_cache,
+                category_names_by_id=category_names_by_id
             )
             
             # Update counters thread-safely
@@ -2039,40 +2232,41 @@ def _process_product_create_with_retry(
     return False
 
 
+# "Shop All" is matched by name alone (any parent), so it gets its own category_cache key
+_SHOP_ALL_CATEGORY_CACHE_KEY = ('Shop All', None, 1)
+
+
 def _get_shop_all_category_id(
-    destination: src_models.CompanyDestinations
+    destination: src_models.CompanyDestinations,
+    category_cache: typing.Optional[typing.Dict] = None
 ) -> typing.Optional[int]:
     """
     Get the "Shop All" category ID from the database.
-    Returns None if not found.
+    Returns None if not found. The result (including None) is kept in category_cache for the run.
     """
-    try:
-        shop_all_category = src_models.BigCommerceCategories.objects.get(
-            name='Shop All',
-            company_destination=destination,
-            tree_id=1
-        )
-        return shop_all_category.external_id
-    except src_models.BigCommerceCategories.DoesNotExist:
+    if category_cache is not None and _SHOP_ALL_CATEGORY_CACHE_KEY in category_cache:
+        return category_cache[_SHOP_ALL_CATEGORY_CACHE_KEY]
+
+    # If multiple exist, take the first one
+    shop_all_category_id = src_models.BigCommerceCategories.objects.filter(
+        name='Shop All',
+        company_destination=destination,
+        tree_id=1
+    ).order_by('id').values_list('external_id', flat=True).first()
+    if shop_all_category_id is None:
         logger.warning('{} "Shop All" category not found in database for destination: {}.'.format(
             _LOG_PREFIX, destination.id
         ))
-        return None
-    except src_models.BigCommerceCategories.MultipleObjectsReturned:
-        # If multiple exist, take the first one
-        shop_all_category = src_models.BigCommerceCategories.objects.filter(
-            name='Shop All',
-            company_destination=destination,
-            tree_id=1
-        ).first()
-        if shop_all_category:
-            return shop_all_category.external_id
-        return None
+
+    if category_cache is not None:
+        category_cache[_SHOP_ALL_CATEGORY_CACHE_KEY] = shop_all_category_id
+    return shop_all_category_id
 
 
 def _get_vehicles_category_id(
     destination: src_models.CompanyDestinations,
-    api_client: bigcommerce_client.BigCommerceApiClient
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    category_cache: typing.Optional[typing.Dict] = None
 ) -> typing.Optional[int]:
     """
     Get or create the "Vehicles" category (parent category for vehicle hierarchy).
@@ -2083,14 +2277,16 @@ def _get_vehicles_category_id(
         parent_id=0,
         destination=destination,
         api_client=api_client,
-        tree_id=1
+        tree_id=1,
+        category_cache=category_cache
     )
 
 
 def _build_vehicle_hierarchy_from_fitments(
     fitments: typing.List[typing.Dict],
     destination: src_models.CompanyDestinations,
-    api_client: bigcommerce_client.BigCommerceApiClient
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    category_cache: typing.Optional[typing.Dict] = None
 ) -> typing.List[int]:
     """
     Build vehicle category hierarchy from fitments and return Model category IDs.
@@ -2102,6 +2298,7 @@ def _build_vehicle_hierarchy_from_fitments(
         fitments: List of fitment dicts with 'year', 'make', 'model' keys
         destination: Company destination
         api_client: BigCommerce API client
+        category_cache: Optional dict of category IDs already resolved during this sync run
         
     Returns:
         List of Model category IDs (one for each unique year/make/model combination)
@@ -2110,7 +2307,7 @@ def _build_vehicle_hierarchy_from_fitments(
         return []
     
     # Get or create Vehicles parent category
-    vehicles_category_id = _get_vehicles_category_id(destination, api_client)
+    vehicles_category_id = _get_vehicles_category_id(destination, api_client, category_cache=category_cache)
     if not vehicles_category_id:
         logger.warning('{} Failed to get or create Vehicles category. Skipping fitment hierarchy.'.format(
             _LOG_PREFIX
@@ -2154,7 +2351,8 @@ def _build_vehicle_hierarchy_from_fitments(
                 parent_id=vehicles_category_id,
                 destination=destination,
                 api_client=api_client,
-                tree_id=1
+                tree_id=1,
+                category_cache=category_cache
             )
             if not year_category_id:
                 logger.warning('{} Failed to get or create Year category: {}. Skipping fitment.'.format(
@@ -2168,7 +2366,8 @@ def _build_vehicle_hierarchy_from_fitments(
                 parent_id=year_category_id,
                 destination=destination,
                 api_client=api_client,
-                tree_id=1
+                tree_id=1,
+                category_cache=category_cache
             )
             if not make_category_id:
                 logger.warning('{} Failed to get or create Make category: {} (Year: {}). Skipping fitment.'.format(
@@ -2182,7 +2381,8 @@ def _build_vehicle_hierarchy_from_fitments(
                 parent_id=make_category_id,
                 destination=destination,
                 api_client=api_client,
-                tree_id=1
+                tree_id=1,
+                category_cache=category_cache
             )
             if model_category_id:
                 model_category_ids.append(model_category_id)
@@ -2199,30 +2399,155 @@ def _build_vehicle_hierarchy_from_fitments(
     return model_category_ids
 
 
+# BigCommerce API limit for category names
+_MAX_CATEGORY_NAME_LENGTH = 50
+# Categories sent per create_category request when pre-creating a sync run's categories
+_CATEGORY_CREATE_BATCH_SIZE = 50
+
+
+def _truncate_category_name(category_name: str) -> str:
+    return category_name[:_MAX_CATEGORY_NAME_LENGTH] if len(category_name) > _MAX_CATEGORY_NAME_LENGTH else category_name
+
+
+def _prepare_bigcommerce_categories(
+    products_for_sync: typing.List[src_messages.BigCommercePart],
+    destination: src_models.CompanyDestinations,
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    category_cache: typing.Dict,
+    tree_id: int = 1
+) -> None:
+    """
+    Fill category_cache with the category and subcategory IDs needed by products_for_sync.
+    Existing categories are read in one query; missing ones are created with batched API calls
+    per level (categories, then subcategories) and saved with bulk_create. Anything not resolved
+    here is left to _get_or_create_bigcommerce_category per product.
+    """
+    # Lowest id wins for duplicate (name, parent_id), matching the .first() lookup
+    for name, parent_id, external_id in src_models.BigCommerceCategories.objects.filter(
+        company_destination=destination,
+        tree_id=tree_id
+    ).order_by('-id').values_list('name', 'parent_id', 'external_id'):
+        category_cache[(name, parent_id, tree_id)] = external_id
+
+    category_names = set()
+    subcategory_names = set()
+    for product_to_sync in products_for_sync:
+        if not product_to_sync.category:
+            continue
+        category_name = _truncate_category_name(product_to_sync.category)
+        category_names.add(category_name)
+        if product_to_sync.subcategory:
+            subcategory_names.add((_truncate_category_name(product_to_sync.subcategory), category_name))
+
+    _create_bigcommerce_categories(
+        categories=sorted(
+            (category_name, 0) for category_name in category_names
+            if (category_name, 0, tree_id) not in category_cache
+        ),
+        destination=destination,
+        api_client=api_client,
+        category_cache=category_cache,
+        tree_id=tree_id
+    )
+
+    missing_subcategories = set()
+    for subcategory_name, category_name in subcategory_names:
+        parent_id = category_cache.get((category_name, 0, tree_id))
+        if parent_id and (subcategory_name, parent_id, tree_id) not in category_cache:
+            missing_subcategories.add((subcategory_name, parent_id))
+
+    _create_bigcommerce_categories(
+        categories=sorted(missing_subcategories),
+        destination=destination,
+        api_client=api_client,
+        category_cache=category_cache,
+        tree_id=tree_id
+    )
+
+
+def _create_bigcommerce_categories(
+    categories: typing.List[typing.Tuple[str, int]],
+    destination: src_models.CompanyDestinations,
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    category_cache: typing.Dict,
+    tree_id: int = 1
+) -> None:
+    """Create (name, parent_id) categories in batches, save them and add them to category_cache."""
+    for i in range(0, len(categories), _CATEGORY_CREATE_BATCH_SIZE):
+        category_data = [
+            {
+                'name': category_name,
+                'parent_id': parent_id,
+                'tree_id': tree_id,
+                'is_visible': True,
+            }
+            for category_name, parent_id in categories[i : i + _CATEGORY_CREATE_BATCH_SIZE]
+        ]
+
+        try:
+            category_response = api_client.create_category(category_data=category_data)
+        except Exception as e:
+            logger.error('{} Error creating {} BigCommerce categories. Error: {}. They will be created per product.'.format(
+                _LOG_PREFIX, len(category_data), str(e)
+            ))
+            continue
+
+        new_categories = []
+        for category_result in category_response or []:
+            # BigCommerce returns 'category_id' not 'id'
+            external_id = category_result.get('category_id')
+            if not external_id:
+                continue
+
+            response_name = category_result.get('name')
+            response_parent_id = category_result.get('parent_id', 0)
+            response_tree_id = category_result.get('tree_id', tree_id)
+            new_categories.append(
+                src_models.BigCommerceCategories(
+                    external_id=external_id,
+                    name=response_name,
+                    parent_id=response_parent_id,
+                    tree_id=response_tree_id,
+                    company_destination=destination,
+                )
+            )
+            category_cache[(response_name, response_parent_id, response_tree_id)] = external_id
+
+        src_models.BigCommerceCategories.objects.bulk_create(new_categories, batch_size=500, ignore_conflicts=True)
+        logger.info('{} Created {} new BigCommerce categories.'.format(_LOG_PREFIX, len(new_categories)))
+
+
 def _get_or_create_bigcommerce_category(
     category_name: str,
     parent_id: int,
     destination: src_models.CompanyDestinations,
     api_client: bigcommerce_client.BigCommerceApiClient,
-    tree_id: int = 1
+    tree_id: int = 1,
+    category_cache: typing.Optional[typing.Dict] = None
 ) -> typing.Optional[int]:
     """
     Get or create a BigCommerce category.
     Returns the category external_id (BigCommerce category ID) or None if creation fails.
     BigCommerce has a 50 character limit for category names, so names are truncated if needed.
+    If category_cache is given, resolved IDs are read from and stored in it, keyed by
+    (name, parent_id, tree_id); failures are not cached so they are retried.
     """
     if not category_name:
         return None
     
-    # Truncate category name to 50 characters (BigCommerce API limit)
-    MAX_CATEGORY_NAME_LENGTH = 50
-    truncated_category_name = category_name[:MAX_CATEGORY_NAME_LENGTH] if len(category_name) > MAX_CATEGORY_NAME_LENGTH else category_name
+    truncated_category_name = _truncate_category_name(category_name)
     
     if truncated_category_name != category_name:
         logger.debug('{} Truncated category name from {} to {} characters: "{}" -> "{}"'.format(
             _LOG_PREFIX, len(category_name), len(truncated_category_name), category_name, truncated_category_name
         ))
     
+    cache_key = (truncated_category_name, parent_id, tree_id)
+    if category_cache is not None:
+        cached_external_id = category_cache.get(cache_key)
+        if cached_external_id:
+            return cached_external_id
+
     # Check if category exists in database (using truncated name)
     existing_category = src_models.BigCommerceCategories.objects.filter(
         name=truncated_category_name,
@@ -2232,6 +2557,8 @@ def _get_or_create_bigcommerce_category(
     ).first()
     
     if existing_category:
+        if category_cache is not None:
+            category_cache[cache_key] = existing_category.external_id
         return existing_category.external_id
     
     # Category doesn't exist, create it via API
@@ -2267,6 +2594,8 @@ def _get_or_create_bigcommerce_category(
                 logger.info('{} Created new BigCommerce category: {} (id: {}, parent_id: {})'.format(
                     _LOG_PREFIX, response_name, external_id, response_parent_id
                 ))
+                if category_cache is not None:
+                    category_cache[cache_key] = external_id
                 return external_id
             else:
                 logger.error('{} Failed to create BigCommerce category: {}. No category_id returned.'.format(
@@ -2285,6 +2614,70 @@ def _get_or_create_bigcommerce_category(
         return None
 
 
+def _get_product_category_ids(
+    product_to_sync: src_messages.BigCommercePart,
+    destination: src_models.CompanyDestinations,
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    category_cache: typing.Optional[typing.Dict] = None
+) -> typing.List[int]:
+    """
+    Get or create the category, subcategory, vehicle and "Shop All" categories for a product.
+    Returns the BigCommerce category IDs to assign to the product.
+    """
+    category_ids = []
+    if product_to_sync.category:
+        category_id = _get_or_create_bigcommerce_category(
+            category_name=product_to_sync.category,
+            parent_id=0,
+            destination=destination,
+            api_client=api_client,
+            tree_id=1,
+            category_cache=category_cache
+        )
+        if category_id:
+            category_ids.append(category_id)
+
+            # If subcategory exists, create it as child of category
+            if product_to_sync.subcategory:
+                subcategory_id = _get_or_create_bigcommerce_category(
+                    category_name=product_to_sync.subcategory,
+                    parent_id=category_id,
+                    destination=destination,
+                    api_client=api_client,
+                    tree_id=1,
+                    category_cache=category_cache
+                )
+                if subcategory_id:
+                    category_ids.append(subcategory_id)
+
+    # Build vehicle hierarchy from fitments and add Model category IDs
+    if product_to_sync.fitments:
+        fitment_model_category_ids = _build_vehicle_hierarchy_from_fitments(
+            fitments=product_to_sync.fitments,
+            destination=destination,
+            api_client=api_client,
+            category_cache=category_cache
+        )
+        for model_category_id in fitment_model_category_ids:
+            if model_category_id not in category_ids:
+                category_ids.append(model_category_id)
+
+    # Always add "Shop All" category
+    shop_all_category_id = _get_shop_all_category_id(destination, category_cache=category_cache)
+    if shop_all_category_id and shop_all_category_id not in category_ids:
+        category_ids.append(shop_all_category_id)
+
+    return category_ids
+
+
+# BigCommerceParts columns refreshed after a product update; the part was prefetched in
+# _categorize_products_for_sync, so the rest of the row is left alone
+_BIGCOMMERCE_PART_SYNC_FIELDS = ('external_id', 'raw_data', 'updated_at')
+
+# Product PUT statuses that may mean BigCommerce rejected the inline images (bad request / validation)
+_INLINE_IMAGE_REJECTION_STATUS_CODES = frozenset((400, 422))
+
+
 def _update_product_on_bigcommerce(
     product_to_sync: src_messages.BigCommercePart,
     bigcommerce_part: src_models.BigCommerceParts,
@@ -2292,7 +2685,9 @@ def _update_product_on_bigcommerce(
     destination: src_models.CompanyDestinations,
     brand: src_models.Brands,
     api_client: bigcommerce_client.BigCommerceApiClient,
-    execution_run: src_models.CompanyDestinationExecutionRun
+    execution_run: src_models.CompanyDestinationExecutionRun,
+    category_cache: typing.Optional[typing.Dict] = None,
+    category_names_by_id: typing.Optional[typing.Dict] = None
 ) -> bool:
     try:
         logger.info('{} Updating product on BigCommerce (sku={}, external_id={}).'.format(
@@ -2339,51 +2734,14 @@ def _update_product_on_bigcommerce(
                 if field_id:
                     field_data['id'] = field_id
             custom_fields_for_payload.append(field_data)
-        
-        # Temporarily set custom_fields for the payload
-        original_custom_fields = product_to_sync.custom_fields
-        product_to_sync.custom_fields = custom_fields_for_payload
 
         # Get or create categories
-        category_ids = []
-        if product_to_sync.category:
-            category_id = _get_or_create_bigcommerce_category(
-                category_name=product_to_sync.category,
-                parent_id=0,
-                destination=destination,
-                api_client=api_client,
-                tree_id=1
-            )
-            if category_id:
-                category_ids.append(category_id)
-                
-                # If subcategory exists, create it as child of category
-                if product_to_sync.subcategory:
-                    subcategory_id = _get_or_create_bigcommerce_category(
-                        category_name=product_to_sync.subcategory,
-                        parent_id=category_id,
-                        destination=destination,
-                        api_client=api_client,
-                        tree_id=1
-                    )
-                    if subcategory_id:
-                        category_ids.append(subcategory_id)
-        
-        # Build vehicle hierarchy from fitments and add Model category IDs
-        if product_to_sync.fitments:
-            fitment_model_category_ids = _build_vehicle_hierarchy_from_fitments(
-                fitments=product_to_sync.fitments,
-                destination=destination,
-                api_client=api_client
-            )
-            for model_category_id in fitment_model_category_ids:
-                if model_category_id not in category_ids:
-                    category_ids.append(model_category_id)
-        
-        # Always add "Shop All" category
-        shop_all_category_id = _get_shop_all_category_id(destination)
-        if shop_all_category_id and shop_all_category_id not in category_ids:
-            category_ids.append(shop_all_category_id)
+        category_ids = _get_product_category_ids(
+            product_to_sync=product_to_sync,
+            destination=destination,
+            api_client=api_client,
+            category_cache=category_cache
+        )
 
         try:
             # Include custom_fields in the main update payload (for create/update)
@@ -2391,7 +2749,8 @@ def _update_product_on_bigcommerce(
                 product_to_sync, 
                 include_images=False,
                 include_custom_fields=True,
-                category_ids=category_ids if category_ids else None
+                category_ids=category_ids if category_ids else None,
+                custom_fields_override=custom_fields_for_payload
             )
         except Exception as e:
             logger.error('{} Error transforming product data for update (sku={}). Error: {}.'.format(
@@ -2399,11 +2758,63 @@ def _update_product_on_bigcommerce(
             ))
             return False
 
-        # try:
-        product_response = api_client.update_product(
-            product_id=product_id,
-            product_data=product_api_data
-        )
+        # New images by URL (first entry wins, in product order) and the URLs already on the product
+        new_images_by_url = {}
+        images_to_delete = set()
+        images_to_create = []
+        if product_to_sync.images:
+            for img in product_to_sync.images:
+                image_url = img.get('image_url', '').strip()
+                if image_url:
+                    new_images_by_url.setdefault(image_url, img)
+
+            existing_image_urls = set()
+            if company_destination_part and company_destination_part.destination_data:
+                for existing_img in company_destination_part.destination_data.get('images', []):
+                    if isinstance(existing_img, dict):
+                        image_url = existing_img.get('image_url', '').strip()
+                        if image_url:
+                            existing_image_urls.add(image_url)
+
+            images_to_delete = existing_image_urls.difference(new_images_by_url)
+            images_to_create = [
+                image_url for image_url in new_images_by_url if image_url not in existing_image_urls
+            ]
+
+        # When images are only being added, send them inline with the product PUT (which returns the
+        # product with its images) instead of one POST per image plus a get_product refetch.
+        # Removals still go through the per-image endpoints since the PUT can't delete images.
+        images_sent_inline = bool(images_to_create) and not images_to_delete
+        if images_sent_inline:
+            product_api_data['images'] = [
+                {
+                    'image_url': image_url,
+                    'is_thumbnail': new_images_by_url[image_url].get('is_thumbnail', False),
+                }
+                for image_url in images_to_create
+            ]
+
+        try:
+            product_response = api_client.update_product(
+                product_id=product_id,
+                product_data=product_api_data
+            )
+        except bigcommerce_exceptions.BigCommerceAPIBadResponseCodeError as e:
+            # Only a validation rejection can be down to the inline images; rate limits, server
+            # errors and the rest go to _process_product_update_with_retry and its backoff
+            if not images_sent_inline or e.code not in _INLINE_IMAGE_REJECTION_STATUS_CODES:
+                raise
+            # A rejected image URL shouldn't fail the whole update; retry without images and
+            # fall back to the per-image endpoints below, where failures are only logged
+            logger.warning('{} Product update with inline images failed (sku={}). Retrying without images. Error: {}.'.format(
+                _LOG_PREFIX, product_to_sync.sku, str(e)
+            ))
+            del product_api_data['images']
+            images_sent_inline = False
+            product_response = api_client.update_product(
+                product_id=product_id,
+                product_data=product_api_data
+            )
         external_id = str(product_response.get('id', bigcommerce_part.external_id))
         # except bigcommerce_exceptions.BigCommerceAPIException as e:
         #     logger.error('{} Error updating product on BigCommerce API (sku={}). Error: {}.'.format(
@@ -2411,27 +2822,8 @@ def _update_product_on_bigcommerce(
         #     ))
         #     return False
 
-        if product_to_sync.images:
+        if images_to_delete or (images_to_create and not images_sent_inline):
             try:
-                new_image_urls = set()
-                for img in product_to_sync.images:
-                    image_url = img.get('image_url', '').strip()
-                    if image_url:
-                        new_image_urls.add(image_url)
-
-                existing_image_urls = set()
-                if company_destination_part and company_destination_part.destination_data:
-                    destination_data = company_destination_part.destination_data
-                    existing_images = destination_data.get('images', [])
-                    for existing_img in existing_images:
-                        if isinstance(existing_img, dict):
-                            image_url = existing_img.get('image_url', '').strip()
-                            if image_url:
-                                existing_image_urls.add(image_url)
-
-                images_to_delete = existing_image_urls - new_image_urls
-                images_to_create = new_image_urls - existing_image_urls
-
                 if images_to_delete:
                     existing_images_api = api_client.get_product_images(product_id)
                     existing_image_map = {}
@@ -2448,71 +2840,50 @@ def _update_product_on_bigcommerce(
                         if image_url:
                             existing_image_map[image_url] = image_id
 
-                    for image_url in images_to_delete:
-                        image_id = existing_image_map.get(image_url)
-                        if not image_id:
-                            continue
-                        try:
-                            api_client.delete_product_image(product_id, image_id)
-                            logger.debug('{} Deleted image (sku={}, image_id={}, image_url={}).'.format(
-                                _LOG_PREFIX, product_to_sync.sku, image_id, image_url
-                            ))
-                        except bigcommerce_exceptions.BigCommerceAPIException as e:
-                            logger.warning('{} Error deleting existing image (sku={}, image_id={}). Error: {}.'.format(
-                                _LOG_PREFIX, product_to_sync.sku, image_id, str(e)
-                            ))
-
-                for img in product_to_sync.images:
-                    image_url = img.get('image_url', '').strip()
-                    if not image_url or image_url not in images_to_create:
-                        continue
-                    try:
-                        api_client.create_product_image(
-                            product_id=product_id,
-                            image_data={
-                                'image_url': image_url,
-                                'is_thumbnail': img.get('is_thumbnail', False),
-                            }
-                        )
-                        logger.debug('{} Created image (sku={}, image_url={}).'.format(
-                            _LOG_PREFIX, product_to_sync.sku, image_url
-                        ))
-                    except bigcommerce_exceptions.BigCommerceAPIException as e:
-                        logger.warning('{} Error creating image (sku={}, image_url={}). Error: {}.'.format(
-                            _LOG_PREFIX, product_to_sync.sku, image_url, str(e)
-                        ))
+                    delete_tasks = [
+                        (image_id, image_url)
+                        for image_url in images_to_delete
+                        if (image_id := existing_image_map.get(image_url))
+                    ]
+                    _run_product_subresource_calls(
+                        lambda task: _delete_product_image(api_client, product_id, product_to_sync.sku, *task),
+                        delete_tasks
+                    )
 
-                if images_to_delete or images_to_create:
-                    try:
-                        product_response = api_client.get_product(product_id)
-                    except bigcommerce_exceptions.BigCommerceAPIException as e:
-                        logger.warning('{} Error fetching updated product after image changes (sku={}). Error: {}.'.format(
-                            _LOG_PREFIX, product_to_sync.sku, str(e)
-                        ))
+                # Deletes finish before creates start, same order as before
+                create_tasks = [
+                    (image_url, new_images_by_url[image_url].get('is_thumbnail', False))
+                    for image_url in images_to_create
+                ]
+                _run_product_subresource_calls(
+                    lambda task: _create_product_image(api_client, product_id, product_to_sync.sku, *task),
+                    create_tasks
+                )
+
+                try:
+                    product_response = api_client.get_product(product_id)
+                except bigcommerce_exceptions.BigCommerceAPIException as e:
+                    logger.warning('{} Error fetching updated product after image changes (sku={}). Error: {}.'.format(
+                        _LOG_PREFIX, product_to_sync.sku, str(e)
+                    ))
             except Exception as e:
                 logger.warning('{} Error managing images for product (sku={}). Error: {}.'.format(
                     _LOG_PREFIX, product_to_sync.sku, str(e)
                 ))
 
-        # Restore original custom_fields
-        product_to_sync.custom_fields = original_custom_fields
-
         # Handle custom fields deletion separately (only for fields that exist in old but not in new)
+        # The product PUT upserts custom_fields but never removes them, so removals need their own DELETEs
         try:
             # Delete removed fields (exist only in old)
-            for field_name, old_field in old_fields_map.items():
-                if field_name not in new_fields_map:
-                    field_id = old_field.get('id')
-                    if field_id:
-                        try:
-                            api_client.delete_product_custom_field(product_id, field_id)
-                            logger.debug('{} Deleted custom field (sku={}, field_id={}, name={}).'.format(
-                                _LOG_PREFIX, product_to_sync.sku, field_id, field_name
-                            ))
-                        except bigcommerce_exceptions.BigCommerceAPIException as e:
-                            logger.warning('{} Error deleting custom field (sku={}, field_id={}, name={}). Error: {}.'.format(
-                                _LOG_PREFIX, product_to_sync.sku, field_id, field_name, str(e)
-                            ))
+            delete_tasks = [
+                (field_id, field_name)
+                for field_name, old_field in old_fields_map.items()
+                if field_name not in new_fields_map and (field_id := old_field.get('id'))
+            ]
+            _run_product_subresource_calls(
+                lambda task: _delete_product_custom_field(api_client, product_id, product_to_sync.sku, *task),
+                delete_tasks
+            )
         except Exception as e:
             logger.warning('{} Error deleting custom fields for product (sku={}). Error: {}.'.format(
                 _LOG_PREFIX, product_to_sync.sku, str(e)
@@ -2524,12 +2895,13 @@ def _update_product_on_bigcommerce(
             destination=destination,
             brand=brand,
             external_id=external_id,
-            bigcommerce_response=product_response
+            bigcommerce_response=product_response,
+            category_names_by_id=category_names_by_id
         )
 
         bigcommerce_part.external_id = external_id
-        bigcommerce_part.raw_data = product_response
-        bigcommerce_part.save()
+        bigcommerce_part.raw_data = _minimize_raw_data(product_response)
+        bigcommerce_part.save(update_fields=_BIGCOMMERCE_PART_SYNC_FIELDS)
 
         _mark_history_as_synced(company_destination_part, execution_run)
 
@@ -2550,13 +2922,87 @@ def _update_product_on_bigcommerce(
         return False
 
 
+# Image / custom field calls in flight across all product workers. The _MAX_WORKERS product workers each
+# hold one connection of the client's pooled session, so together they stay within SESSION_POOL_MAXSIZE
+# instead of opening (and dropping) connections past the pool
+_PRODUCT_SUBRESOURCE_MAX_WORKERS = max(1, bigcommerce_client.SESSION_POOL_MAXSIZE - _MAX_WORKERS)
+
+# One bounded pool shared by every product update, instead of a new executor per product and call type
+_product_subresource_executor = ThreadPoolExecutor(
+    max_workers=_PRODUCT_SUBRESOURCE_MAX_WORKERS, thread_name_prefix='bigcommerce-subresource'
+)
+
+
+def _run_product_subresource_calls(api_call: typing.Callable, tasks: typing.List[typing.Tuple]) -> None:
+    if not tasks:
+        return
+    if len(tasks) == 1:
+        api_call(tasks[0])
+        return
+    # list() drains the iterator so unexpected errors surface here, like in the sequential loop
+    list(_product_subresource_executor.map(api_call, tasks))
+
+
+def _delete_product_image(
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    product_id: int,
+    sku: str,
+    image_id: int,
+    image_url: str
+) -> None:
+    try:
+        api_client.delete_product_image(product_id, image_id)
+        logger.debug('%s Deleted image (sku=%s, image_id=%s, image_url=%s).', _LOG_PREFIX, sku, image_id, image_url)
+    except bigcommerce_exceptions.BigCommerceAPIException as e:
+        logger.warning('%s Error deleting existing image (sku=%s, image_id=%s). Error: %s.', _LOG_PREFIX, sku, image_id, e)
+
+
+def _create_product_image(
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    product_id: int,
+    sku: str,
+    image_url: str,
+    is_thumbnail: bool
+) -> None:
+    try:
+        api_client.create_product_image(
+            product_id=product_id,
+            image_data={
+                'image_url': image_url,
+                'is_thumbnail': is_thumbnail,
+            }
+        )
+        logger.debug('%s Created image (sku=%s, image_url=%s).', _LOG_PREFIX, sku, image_url)
+    except bigcommerce_exceptions.BigCommerceAPIException as e:
+        logger.warning('%s Error creating image (sku=%s, image_url=%s). Error: %s.', _LOG_PREFIX, sku, image_url, e)
+
+
+def _delete_product_custom_field(
+    api_client: bigcommerce_client.BigCommerceApiClient,
+    product_id: int,
+    sku: str,
+    field_id: int,
+    field_name: str
+) -> None:
+    try:
+        api_client.delete_product_custom_field(product_id, field_id)
+        logger.debug('%s Deleted custom field (sku=%s, field_id=%s, name=%s).', _LOG_PREFIX, sku, field_id, field_name)
+    except bigcommerce_exceptions.BigCommerceAPIException as e:
+        logger.warning(
+            '%s Error deleting custom field (sku=%s, field_id=%s, name=%s). Error: %s.',
+            _LOG_PREFIX, sku, field_id, field_name, e
+        )
+
+
 def _create_product_on_bigcommerce(
     product_to_sync: src_messages.BigCommercePart,
     company_destination_part: typing.Optional[src_models.CompanyDestinationParts],
     destination: src_models.CompanyDestinations,
     brand: src_models.Brands,
     api_client: bigcommerce_client.BigCommerceApiClient,
-    execution_run: src_models.CompanyDestinationExecutionRun
+    execution_run: src_models.CompanyDestinationExecutionRun,
+    category_cache: typing.Optional[typing.Dict] = None,
+    category_names_by_id: typing.Optional[typing.Dict] = None
 ) -> bool:
     try:
         logger.info('{} Creating product on BigCommerce (sku={}).'.format(
@@ -2564,45 +3010,12 @@ def _create_product_on_bigcommerce(
         ))
 
         # Get or create categories
-        category_ids = []
-        if product_to_sync.category:
-            category_id = _get_or_create_bigcommerce_category(
-                category_name=product_to_sync.category,
-                parent_id=0,
-                destination=destination,
-                api_client=api_client,
-                tree_id=1
-            )
-            if category_id:
-                category_ids.append(category_id)
-                
-                # If subcategory exists, create it as child of category
-                if product_to_sync.subcategory:
-                    subcategory_id = _get_or_create_bigcommerce_category(
-                        category_name=product_to_sync.subcategory,
-                        parent_id=category_id,
-                        destination=destination,
-                        api_client=api_client,
-                        tree_id=1
-                    )
-                    if subcategory_id:
-                        category_ids.append(subcategory_id)
-        
-        # Build vehicle hierarchy from fitments and add Model category IDs
-        if product_to_sync.fitments:
-            fitment_model_category_ids = _build_vehicle_hierarchy_from_fitments(
-                fitments=product_to_sync.fitments,
-                destination=destination,
-                api_client=api_client
-            )
-            for model_category_id in fitment_model_category_ids:
-                if model_category_id not in category_ids:
-                    category_ids.append(model_category_id)
-        
-        # Always add "Shop All" category
-        shop_all_category_id = _get_shop_all_category_id(destination)
-        if shop_all_category_id and shop_all_category_id not in category_ids:
-            category_ids.append(shop_all_category_id)
+        category_ids = _get_product_category_ids(
+            product_to_sync=product_to_sync,
+            destination=destination,
+            api_client=api_client,
+            category_cache=category_cache
+        )
 
         try:
             product_api_data = _transform_bigcommerce_part_to_api_format(
@@ -2636,13 +3049,14 @@ def _create_product_on_bigcommerce(
             destination=destination,
             brand=brand,
             external_id=external_id,
-            bigcommerce_response=product_response
+            bigcommerce_response=product_response,
+            category_names_by_id=category_names_by_id
         )
 
         src_models.BigCommerceParts.objects.create(
             external_id=external_id,
             sku=product_to_sync.sku,
-            raw_data=product_response,
+            raw_data=_minimize_raw_data(product_response),
             company_destination=destination,
         )
 
@@ -2671,9 +3085,12 @@ def _upsert_company_destination_part(
     destination: src_models.CompanyDestinations,
     brand: src_models.Brands,
     external_id: str,
-    bigcommerce_response: typing.Dict
+    bigcommerce_response: typing.Dict,
+    category_names_by_id: typing.Optional[typing.Dict] = None
 ) -> src_models.CompanyDestinationParts:
-    destination_data = _convert_bigcommerce_response_to_part_format(bigcommerce_response, destination=destination)
+    destination_data = _convert_bigcommerce_response_to_part_format(
+        bigcommerce_response, destination=destination, category_names_by_id=category_names_by_id
+    )
     source_data = _get_source_data_for_product(product_to_sync, brand)
     
     # Add fitments from source_data to destination_data for comparison purposes
@@ -2714,7 +3131,8 @@ def _transform_bigcommerce_part_to_api_format(
     part: src_messages.BigCommercePart,
     include_images: bool = True,
     include_custom_fields: bool = True,
-    category_ids: typing.Optional[typing.List[int]] = None
+    category_ids: typing.Optional[typing.List[int]] = None,
+    custom_fields_override: typing.Optional[typing.List[typing.Dict]] = None
 ) -> typing.Dict:
     price_value = part.default_price
     if isinstance(price_value, (dict, list)):
@@ -2819,8 +3237,12 @@ def _transform_bigcommerce_part_to_api_format(
         ]
 
     # Include custom_fields if requested (skip if we're clearing them via DELETE calls)
+    # custom_fields_override carries the update payload (with existing field ids) so the part itself isn't mutated
     if include_custom_fields:
-        product_data['custom_fields'] = part.custom_fields if part.custom_fields is not None else []
+        if custom_fields_override is not None:
+            product_data['custom_fields'] = custom_fields_override
+        else:
+            product_data['custom_fields'] = part.custom_fields if part.custom_fields is not None else []
     
     # Add categories if provided
     if category_ids:
@@ -2830,12 +3252,27 @@ def _transform_bigcommerce_part_to_api_format(
 
 
 def _get_source_data_for_product(product: src_messages.BigCommercePart, brand: src_models.Brands) -> typing.Dict:
-    product_dict = dataclasses.asdict(product)
-    return {
-        **product_dict,
-        'brand_id': brand.id,
-        'brand_name': brand.name,
-    }
+    source_data = _part_shallow_dict(product)
+    source_data['brand_id'] = brand.id
+    source_data['brand_name'] = brand.name
+    return source_data
+
+
+def _part_shallow_dict(part: src_messages.BigCommercePart) -> typing.Dict:
+    """
+    BigCommercePart as a dict without dataclasses.asdict's deep copy of every images/custom_fields list.
+    The lists are shared with the part, which is fine since the dicts are only compared and
+    serialized to JSON; don't mutate them in place.
+    """
+    return {field_name: getattr(part, field_name) for field_name in _BIGCOMMERCE_PART_FIELDS}
+
+
+# Only destination_data is compared (and the pk referenced by history rows); source_data is the
+# other large JSON column and would be decoded for nothing
+_CHANGE_DETECTION_PART_FIELDS = ('id', 'part_unique_key', 'destination_data')
+
+# CompanyDestinationPartsHistory rows per INSERT when recording detected changes
+_HISTORY_CREATE_BATCH_SIZE = 500
 
 
 def select_products_for_syncing_into_bigcommerce(
@@ -2847,28 +3284,41 @@ def select_products_for_syncing_into_bigcommerce(
         product.sku for product in products_candidates_for_sync
     ]
 
-    company_destination_parts = src_models.CompanyDestinationParts.objects.filter(
-        part_unique_key__in=candidates_skus
-    )
-    
-    candidates_to_sync_immediately = set(candidates_skus) - set(list(company_destination_parts.values_list('part_unique_key', flat=True)))
-    for product in products_candidates_for_sync:
-        if product.sku in candidates_to_sync_immediately:
-            products_for_syncing.append(product)
-
-    product_candidates_dict = {product.sku: product for product in products_candidates_for_sync}
+    # History rows for changed parts, saved together after the candidate pass
+    pending_history = []
+
+    # Prefetch existing destination parts into {sku: [parts]} so the candidate pass below is in-memory.
+    # part_unique_key isn't unique, so in_bulk() can't be used; every matching part is kept as before.
+    company_destination_parts_by_sku = collections.defaultdict(list)
+    for start in range(0, len(candidates_skus), _SKU_LOOKUP_CHUNK_SIZE):
+        for company_destination_part in src_models.CompanyDestinationParts.objects.filter(
+            part_unique_key__in=candidates_skus[start:start + _SKU_LOOKUP_CHUNK_SIZE]
+        ).only(*_CHANGE_DETECTION_PART_FIELDS):
+            company_destination_parts_by_sku[company_destination_part.part_unique_key].append(
+                company_destination_part
+            )
 
-    for company_destination_part in company_destination_parts:
-        product_candidate = product_candidates_dict.get(company_destination_part.part_unique_key)
-        if not product_candidate:
+    for product_candidate in products_candidates_for_sync:
+        company_destination_parts = company_destination_parts_by_sku.get(product_candidate.sku)
+        if not company_destination_parts:
+            products_for_syncing.append(product_candidate)
             continue
 
-        if _company_destination_part_changed(
-            company_destination_part=company_destination_part,
-            product_candidate=product_candidate,
-            execution_run=execution_run
-        ):
-            products_for_syncing.append(product_candidate)
+        for company_destination_part in company_destination_parts:
+            changed, history = _company_destination_part_changed(
+                company_destination_part=company_destination_part,
+                product_candidate=product_candidate,
+                execution_run=execution_run
+            )
+            if changed:
+                products_for_syncing.append(product_candidate)
+            if history is not None:
+                pending_history.append(history)
+
+    if pending_history:
+        src_models.CompanyDestinationPartsHistory.objects.bulk_create(
+            pending_history, batch_size=_HISTORY_CREATE_BATCH_SIZE
+        )
 
     return products_for_syncing
 
@@ -2877,18 +3327,22 @@ def _company_destination_part_changed(
     company_destination_part: src_models.CompanyDestinationParts,
     product_candidate: src_messages.BigCommercePart,
     execution_run: src_models.CompanyDestinationExecutionRun
-) -> bool:
+) -> typing.Tuple[bool, typing.Optional[src_models.CompanyDestinationPartsHistory]]:
+    """
+    Returns (changed, history). history is an unsaved CompanyDestinationPartsHistory recording the
+    changes, or None when there is nothing to record; the caller saves them in bulk.
+    """
     destination_data = company_destination_part.destination_data
     if not destination_data:
-        return True
+        return True, None
 
     candidate_dict = _bigcommerce_part_to_dict(product_candidate)
     changes = _compare_bigcommerce_parts(destination_data, candidate_dict)
 
     if not changes:
-        return False
+        return False, None
 
-    src_models.CompanyDestinationPartsHistory.objects.create(
+    return True, src_models.CompanyDestinationPartsHistory(
         destination_part=company_destination_part,
         execution_run=execution_run,
         data=candidate_dict,
@@ -2896,23 +3350,58 @@ def _company_destination_part_changed(
         synced=False,
     )
 
-    return True
-
 
 def _bigcommerce_part_to_dict(part: src_messages.BigCommercePart) -> typing.Dict:
     """
     Convert BigCommercePart to dictionary, including derived fields like availability_description.
     """
-    part_dict = dataclasses.asdict(part)
+    part_dict = _part_shallow_dict(part)
     # Calculate and add availability_description based on inventory
     inventory_quantity = int(part.inventory) if part.inventory else 0
     part_dict['availability_description'] = _get_availability_text(inventory_quantity)
     return part_dict
 
 
+_RAW_DATA_KEYS = ('id', 'sku', 'name', 'price', 'inventory_level', 'brand_id')
+_RAW_DATA_IMAGE_KEYS = ('id', 'url_standard', 'is_thumbnail')
+
+
+def _minimize_raw_data(bigcommerce_response: typing.Dict) -> typing.Dict:
+    """
+    Reduce a BigCommerce product response to the keys we actually read back, so BigCommerceParts
+    rows don't carry the full (multi-KB) payload. Used by both the nightly fetch and the sync,
+    so the column has one shape whichever path wrote it last.
+    """
+    raw_data = {key: bigcommerce_response.get(key) for key in _RAW_DATA_KEYS if key in bigcommerce_response}
+
+    images_data = bigcommerce_response.get('images')
+    if isinstance(images_data, dict):
+        images_data = images_data.get('data')
+    if isinstance(images_data, list):
+        raw_data['images'] = {
+            'data': [
+                {key: img.get(key) for key in _RAW_DATA_IMAGE_KEYS}
+                for img in images_data
+                if isinstance(img, dict)
+            ]
+        }
+
+    return raw_data
+
+
+def _load_category_names_by_id(destination: src_models.CompanyDestinations) -> typing.Dict[int, typing.Tuple[str, int]]:
+    return {
+        external_id: (name, parent_id)
+        for external_id, name, parent_id in src_models.BigCommerceCategories.objects.filter(
+            company_destination=destination
+        ).values_list('external_id', 'name', 'parent_id')
+    }
+
+
 def _convert_bigcommerce_response_to_part_format(
     bigcommerce_response: typing.Dict,
-    destination: typing.Optional[src_models.CompanyDestinations] = None
+    destination: typing.Optional[src_models.CompanyDestinations] = None,
+    category_names_by_id: typing.Optional[typing.Dict[int, typing.Tuple[str, int]]] = None
 ) -> typing.Dict:
     images = []
     if 'images' in bigcommerce_response:
@@ -2922,7 +3411,7 @@ def _convert_bigcommerce_response_to_part_format(
         if isinstance(images_data, list):
             for img in images_data:
                 if isinstance(img, dict):
-                    image_url = img.get('url_standard') or img.get('url_thumbnail') or img.get('url') or ''
+                    image_url = (img.get('url_standard') or img.get('url_thumbnail') or img.get('url') or '').strip()
                     if image_url:
                         images.append({
                             'image_url': image_url,
@@ -2932,7 +3421,7 @@ def _convert_bigcommerce_response_to_part_format(
     elif 'primary_image' in bigcommerce_response and bigcommerce_response['primary_image']:
         primary_img = bigcommerce_response['primary_image']
         if isinstance(primary_img, dict):
-            image_url = primary_img.get('url_standard') or primary_img.get('url_thumbnail') or primary_img.get('url') or ''
+            image_url = (primary_img.get('url_standard') or primary_img.get('url_thumbnail') or primary_img.get('url') or '').strip()
             if image_url:
                 images.append({
                     'image_url': image_url,
@@ -2947,42 +3436,18 @@ def _convert_bigcommerce_response_to_part_format(
         if isinstance(custom_fields_data, list):
             custom_fields = custom_fields_data
 
-    cost = 0.0
-    try:
-        cost = float(bigcommerce_response.get('cost_price', 0.0))
-    except (ValueError, TypeError):
-        pass
+    cost = _to_float(bigcommerce_response.get('cost_price', 0.0))
+    if cost is None:
+        cost = 0.0
 
-    msrp = 0.0
-    try:
-        msrp = float(bigcommerce_response.get('retail_price', 0.0))
-    except (ValueError, TypeError):
-        pass
+    msrp = _to_float(bigcommerce_response.get('retail_price', 0.0))
+    if msrp is None:
+        msrp = 0.0
 
-    # Extract width, height, depth
-    width = None
-    try:
-        width_val = bigcommerce_response.get('width')
-        if width_val is not None:
-            width = float(width_val)
-    except (ValueError, TypeError):
-        pass
-    
-    height = None
-    try:
-        height_val = bigcommerce_response.get('height')
-        if height_val is not None:
-            height = float(height_val)
-    except (ValueError, TypeError):
-        pass
-    
-    depth = None
-    try:
-        depth_val = bigcommerce_response.get('depth')
-        if depth_val is not None:
-            depth = float(depth_val)
-    except (ValueError, TypeError):
-        pass
+    # Extract width, height, depth (None when missing or not numeric)
+    width = _to_float(bigcommerce_response.get('width'))
+    height = _to_float(bigcommerce_response.get('height'))
+    depth = _to_float(bigcommerce_response.get('depth'))
 
     inventory_quantity = int(bigcommerce_response.get('inventory_level', 0))
     availability_text = _get_availability_text(inventory_quantity)
@@ -2992,26 +3457,42 @@ def _convert_bigcommerce_response_to_part_format(
     subcategory = None
     category_ids = bigcommerce_response.get('categories', [])
     if category_ids and destination:
-        # Look up category names from database
+        # Look up category names in the per-run map, querying (and adding) only IDs it doesn't have yet,
+        # e.g. vehicle categories created during the run. Without a map, query them all from the database.
         # Filter by destination to ensure we get the right categories
-        categories_query = src_models.BigCommerceCategories.objects.filter(
-            external_id__in=category_ids,
-            company_destination=destination
+        if category_names_by_id is None:
+            category_names_by_id = {}
+        missing_category_ids = [
+            category_id for category_id in category_ids if category_id not in category_names_by_id
+        ]
+        if missing_category_ids:
+            for external_id, name, parent_id in src_models.BigCommerceCategories.objects.filter(
+                external_id__in=missing_category_ids,
+                company_destination=destination
+            ).values_list('external_id', 'name', 'parent_id'):
+                category_names_by_id[external_id] = (name, parent_id)
+
+        categories_list = sorted(
+            (
+                (category_id, *category_names_by_id[category_id])
+                for category_id in category_ids
+                if category_id in category_names_by_id
+            ),
+            key=lambda cat: cat[2]
         )
-        categories_list = list(categories_query.order_by('parent_id'))
-        
+
         # Category is the one with parent_id=0, subcategory is the one with parent_id=category_id
-        parent_category = None
-        for cat in categories_list:
-            if cat.parent_id == 0:
-                if cat.name == 'Shop All':
+        parent_category_id = None
+        for cat_external_id, cat_name, cat_parent_id in categories_list:
+            if cat_parent_id == 0:
+                if cat_name == 'Shop All':
                     continue
 
-                category = cat.name
-                parent_category = cat
-            elif parent_category and cat.parent_id == parent_category.external_id:
+                category = cat_name
+                parent_category_id = cat_external_id
+            elif parent_category_id and cat_parent_id == parent_category_id:
                 # This is a child of the parent category
-                subcategory = cat.name
+                subcategory = cat_name
 
     return {
         'brand_id': int(bigcommerce_response.get('brand_id', 0)),
@@ -3036,185 +3517,114 @@ def _convert_bigcommerce_response_to_part_format(
     }
 
 
+# Fields compared for change detection, in the order changes are reported.
+# images are not compared here - they're reconciled against the API on update.
+_COMPARE_FIELDS = (
+    'brand_id', 'product_title', 'sku', 'mpn', 'default_price', 'cost', 'msrp', 'weight',
+    'width', 'height', 'depth', 'description', 'inventory', 'availability_description',
+    'custom_fields', 'active', 'category', 'subcategory', 'fitments',
+)
+_DIMENSION_FIELDS = frozenset(('width', 'height', 'depth'))
+
+
+def _fields_fingerprint(data: typing.Dict) -> typing.Tuple:
+    return tuple(data.get(field) for field in _COMPARE_FIELDS)
+
+
 def _compare_bigcommerce_parts(
     old_data: typing.Dict,
     new_data: typing.Dict
 ) -> typing.Dict:
-    changes = {}
+    # Unchanged parts are the common case; one tuple comparison rules them out before
+    # the field-by-field checks below
+    if _fields_fingerprint(old_data) == _fields_fingerprint(new_data):
+        return {}
 
-    old_brand_id = old_data.get('brand_id')
-    new_brand_id = new_data.get('brand_id')
-    if _values_different(old_brand_id, new_brand_id):
-        changes['brand_id'] = {'old': old_brand_id, 'new': new_brand_id}
-
-    old_product_title = old_data.get('product_title')
-    new_product_title = new_data.get('product_title')
-    if _values_different(old_product_title, new_product_title):
-        changes['product_title'] = {'old': old_product_title, 'new': new_product_title}
-
-    old_sku = old_data.get('sku')
-    new_sku = new_data.get('sku')
-    if _values_different(old_sku, new_sku):
-        changes['sku'] = {'old': old_sku, 'new': new_sku}
-
-    old_mpn = old_data.get('mpn')
-    new_mpn = new_data.get('mpn')
-    if _values_different(old_mpn, new_mpn):
-        changes['mpn'] = {'old': old_mpn, 'new': new_mpn}
-
-    old_default_price = old_data.get('default_price')
-    new_default_price = new_data.get('default_price')
-    if _values_different(old_default_price, new_default_price):
-        changes['default_price'] = {'old': old_default_price, 'new': new_default_price}
-
-    old_cost = old_data.get('cost')
-    new_cost = new_data.get('cost')
-    if _values_different(old_cost, new_cost):
-        changes['cost'] = {'old': old_cost, 'new': new_cost}
-
-    old_msrp = old_data.get('msrp')
-    new_msrp = new_data.get('msrp')
-    if _values_different(old_msrp, new_msrp):
-        changes['msrp'] = {'old': old_msrp, 'new': new_msrp}
-
-    old_weight = old_data.get('weight')
-    new_weight = new_data.get('weight')
-    if _values_different(old_weight, new_weight):
-        changes['weight'] = {'old': old_weight, 'new': new_weight}
-
-    old_width = old_data.get('width')
-    new_width = new_data.get('width')
-    # Treat None and 0.0 as the same for dimensions
-    if _dimension_values_different(old_width, new_width):
-        changes['width'] = {'old': old_width, 'new': new_width}
-
-    old_height = old_data.get('height')
-    new_height = new_data.get('height')
-    # Treat None and 0.0 as the same for dimensions
-    if _dimension_values_different(old_height, new_height):
-        changes['height'] = {'old': old_height, 'new': new_height}
-
-    old_depth = old_data.get('depth')
-    new_depth = new_data.get('depth')
-    # Treat None and 0.0 as the same for dimensions
-    if _dimension_values_different(old_depth, new_depth):
-        changes['depth'] = {'old': old_depth, 'new': new_depth}
-
-    old_description = old_data.get('description')
-    new_description = new_data.get('description')
-    if _values_different(old_description, new_description):
-        changes['description'] = {'old': old_description, 'new': new_description}
-
-    # old_images = old_data.get('images')
-    # new_images = new_data.get('images')
-    # if _images_different(old_images, new_images):
-    #     changes['images'] = {'old': old_images, 'new': new_images}
-
-    old_inventory = old_data.get('inventory')
-    new_inventory = new_data.get('inventory')
-    if _values_different(old_inventory, new_inventory):
-        changes['inventory'] = {'old': old_inventory, 'new': new_inventory}
-    
-    # Availability description is derived from inventory, so compare it too
-    old_availability = old_data.get('availability_description')
-    new_availability = new_data.get('availability_description')
-    if _values_different(old_availability, new_availability):
-        changes['availability_description'] = {'old': old_availability, 'new': new_availability}
-
-    old_custom_fields = old_data.get('custom_fields')
-    new_custom_fields = new_data.get('custom_fields')
-    if _values_different(old_custom_fields, new_custom_fields):
-        changes['custom_fields'] = {'old': old_custom_fields, 'new': new_custom_fields}
-
-    old_active = old_data.get('active')
-    new_active = new_data.get('active')
-    if _values_different(old_active, new_active):
-        changes['active'] = {'old': old_active, 'new': new_active}
-
-    old_category = old_data.get('category')
-    new_category = new_data.get('category')
-    if _values_different(old_category, new_category):
-        changes['category'] = {'old': old_category, 'new': new_category}
-
-    old_subcategory = old_data.get('subcategory')
-    new_subcategory = new_data.get('subcategory')
-    if _values_different(old_subcategory, new_subcategory):
-        changes['subcategory'] = {'old': old_subcategory, 'new': new_subcategory}
-
-    old_fitments = old_data.get('fitments')
-    new_fitments = new_data.get('fitments')
-    if _values_different(old_fitments, new_fitments):
-        changes['fitments'] = {'old': old_fitments, 'new': new_fitments}
+    changes = {}
+    for field in _COMPARE_FIELDS:
+        old_value = old_data.get(field)
+        new_value = new_data.get(field)
+        if field in _DIMENSION_FIELDS:
+            # Treat None and 0.0 as the same for dimensions
+            is_different = _dimension_values_different(old_value, new_value)
+        else:
+            is_different = _values_different(old_value, new_value)
+        if is_different:
+            changes[field] = {'old': old_value, 'new': new_value}
 
     return changes
 
 
-def _images_different(old_images: typing.Any, new_images: typing.Any) -> bool:
-    if old_images == new_images:
-        return False
+def _fitment_sort_key(fitment: typing.Dict) -> typing.Tuple[str, str, str]:
+    return (str(fitment.get('year', '')), str(fitment.get('make', '')), str(fitment.get('model', '')))
 
-    if old_images is None or new_images is None:
-        return old_images != new_images
 
-    if not isinstance(old_images, list) or not isinstance(new_images, list):
-        return old_images != new_images
+def _dict_items_sort_key(item: typing.Dict) -> typing.Tuple:
+    return tuple(sorted(item.items()))
 
-    if len(old_images) != len(new_images):
-        return True
 
-    if not old_images and not new_images:
+def _dict_list_bag(items: typing.List[typing.Dict]) -> collections.Counter:
+    return collections.Counter(tuple(sorted(item.items())) for item in items if type(item) is dict)
+
+
+def _list_values_different(old_value: list, new_value: list) -> bool:
+    old_len = len(old_value)
+    new_len = len(new_value)
+    if old_len != new_len:
+        return True
+    if not old_len:
         return False
+    if type(old_value[0]) is dict and type(new_value[0]) is dict:
+        # Check if this is fitments data (has year, make, model keys)
+        first_old = old_value[0]
+        if 'year' in first_old and 'make' in first_old and 'model' in first_old:
+            # Sort fitments by year, make, model
+            old_sorted = sorted(old_value, key=_fitment_sort_key)
+            new_sorted = sorted(new_value, key=_fitment_sort_key)
+            return old_sorted != new_sorted
+        else:
+            # Generic dict comparison (e.g. custom_fields) - compare as a multiset of items
+            try:
+                return _dict_list_bag(old_value) != _dict_list_bag(new_value)
+            except TypeError:
+                # Some item value is unhashable (nested list/dict) - sort by all keys instead
+                old_sorted = sorted(old_value, key=_dict_items_sort_key)
+                new_sorted = sorted(new_value, key=_dict_items_sort_key)
+                return old_sorted != new_sorted
+    return old_value != new_value
+
 
-    def normalize_image(img: typing.Dict) -> str:
-        return img.get('image_url', '').strip()
+_numbers_close = functools.partial(math.isclose, rel_tol=0.0, abs_tol=0.01)
 
-    old_normalized = sorted([normalize_image(img) for img in old_images if isinstance(img, dict)])
-    new_normalized = sorted([normalize_image(img) for img in new_images if isinstance(img, dict)])
 
-    return old_normalized != new_normalized
+def _numbers_different(old_value: typing.Union[int, float], new_value: typing.Union[int, float]) -> bool:
+    # NaN is never close to anything, so it always registers as a change
+    return not _numbers_close(old_value, new_value)
+
+
+# Comparators keyed on (type(old_value), type(new_value)); anything else falls back to !=
+_VALUE_COMPARATORS = {
+    (list, list): _list_values_different,
+    (float, float): _numbers_different,
+    (int, float): _numbers_different,
+    (float, int): _numbers_different,
+}
 
 
 def _values_different(old_value: typing.Any, new_value: typing.Any) -> bool:
+    # Same object (e.g. a list shared between both sides) - skip the structural walk
+    if old_value is new_value:
+        return False
+
     if old_value == new_value:
         return False
 
     if old_value is None or new_value is None:
         return old_value != new_value
 
-    if isinstance(old_value, list) and isinstance(new_value, list):
-        if len(old_value) != len(new_value):
-            return True
-        if not old_value and not new_value:
-            return False
-        if old_value and new_value and isinstance(old_value[0], dict) and isinstance(new_value[0], dict):
-            # Check if this is fitments data (has year, make, model keys)
-            first_old = old_value[0]
-            first_new = new_value[0]
-            if 'year' in first_old and 'make' in first_old and 'model' in first_old:
-                # Sort fitments by year, make, model
-                old_sorted = sorted(old_value, key=lambda x: (str(x.get('year', '')), str(x.get('make', '')), str(x.get('model', ''))))
-                new_sorted = sorted(new_value, key=lambda x: (str(x.get('year', '')), str(x.get('make', '')), str(x.get('model', ''))))
-                return old_sorted != new_sorted
-            elif 'image_url' in first_old:
-                # Sort images by image_url and is_thumbnail
-                old_sorted = sorted(old_value, key=lambda x: (x.get('image_url', ''), x.get('is_thumbnail', False)))
-                new_sorted = sorted(new_value, key=lambda x: (x.get('image_url', ''), x.get('is_thumbnail', False)))
-                return old_sorted != new_sorted
-            else:
-                # Generic dict comparison - sort by all keys
-                old_sorted = sorted(old_value, key=lambda x: tuple(sorted(x.items())))
-                new_sorted = sorted(new_value, key=lambda x: tuple(sorted(x.items())))
-                return old_sorted != new_sorted
-        return old_value != new_value
-
-    if isinstance(old_value, float) and isinstance(new_value, float):
-        return abs(old_value - new_value) > 0.01
-
-    if isinstance(old_value, int) and isinstance(new_value, float):
-        return abs(float(old_value) - new_value) > 0.01
-
-    if isinstance(old_value, float) and isinstance(new_value, int):
-        return abs(old_value - float(new_value)) > 0.01
+    comparator = _VALUE_COMPARATORS.get((type(old_value), type(new_value)))
+    if comparator is not None:
+        return comparator(old_value, new_value)
 
     return old_value != new_value
 
@@ -2,7 +2,7 @@ import dataclasses
 import typing
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BigCommercePart:
     brand_id: int
     product_title: str
@@ -353,6 +353,12 @@ class CompanyDestinationParts(django_db_models.Model):
     class Meta:
         db_table = "company_destination_parts"
         # unique_together = ["company_destination"]
+        indexes = [
+            django_db_models.Index(
+                fields=["company_destination", "brand", "part_unique_key"],
+                name="cdp_dest_brand_key_idx",
+            ),
+        ]
 
 
 
@@ -682,6 +688,9 @@ class BigCommerceParts(django_db_models.Model):
     class Meta:
         db_table = "bigcommerce_parts"
         unique_together = ["external_id", "sku", "company_destination"]
+        indexes = [
+            django_db_models.Index(fields=["company_destination", "sku"], name="bc_parts_dest_sku_idx"),
+        ]
 
 
 class BigCommerceBrands(django_db_models.Model):
@@ -0,0 +1 @@
+"""Run with `python manage.py test src.tests` (src is a namespace package, so a bare `manage.py test` won't find these)."""
@@ -0,0 +1,447 @@
+import dataclasses
+import types
+from concurrent.futures import Future
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from src import messages as src_messages
+from src import models as src_models
+from src.integrations.ecommerce.bigcommerce.gateways import exceptions as bigcommerce_exceptions
+from src.integrations.ecommerce.bigcommerce.services import bigcommerce as bigcommerce_services
+
+
+def _sdc_item(**overrides):
+    fields = {
+        'marketing_description': None,
+        'extended_description': None,
+        'long_description': None,
+        'features_and_benefits': None,
+        'application_summary': None,
+        'product_attributes': None,
+        'quantity_per_application': None,
+        'country_of_origin': None,
+        'warranty': None,
+        'length_for_case': None,
+        'width_for_case': None,
+        'height_for_case': None,
+        'weight_for_case': None,
+        'associated_comments': None,
+        'installation_instructions': None,
+    }
+    fields.update(overrides)
+    return types.SimpleNamespace(**fields)
+
+
+class DescriptionHtmlEscapingTests(SimpleTestCase):
+    def test_sdc_description_escapes_text_sections(self):
+        description = bigcommerce_services._get_sdc_description(_sdc_item(
+            marketing_description='Fits <script>alert(1)</script> & more',
+            application_summary='Use with 3/4" <hose>',
+            features_and_benefits='Steel & aluminum; <b>bold</b>',
+            country_of_origin='<US>',
+        ))
+
+        self.assertIn('<p>Fits &lt;script&gt;alert(1)&lt;/script&gt; &amp; more</p>', description)
+        self.assertIn('<p>Use with 3/4" &lt;hose&gt;</p>', description)
+        self.assertIn('<li>Steel &amp; aluminum</li><li>&lt;b&gt;bold&lt;/b&gt;</li>', description)
+        self.assertIn('Country of Origin: &lt;US&gt;', description)
+        self.assertNotIn('<script>', description)
+
+    def test_sdc_description_escapes_instruction_link(self):
+        description = bigcommerce_services._get_sdc_description(_sdc_item(
+            installation_instructions='https://example.com/docs/a"b<c>.pdf',
+        ))
+
+        self.assertIn('<a href="https://example.com/docs/a&quot;b&lt;c&gt;.pdf" target="_blank">', description)
+
+    def test_sdc_fitment_table_escapes_cells(self):
+        fitment = types.SimpleNamespace(year=2020, make='Ford & Co', model='<F-150>')
+
+        table = bigcommerce_services._get_sdc_fitment_table([fitment])
+
+        self.assertIn('<td style="text-align: center;">2020</td>', table)
+        self.assertIn('<td style="text-align: center;">Ford &amp; Co</td>', table)
+        self.assertIn('<td style="text-align: center;">&lt;F-150&gt;</td>', table)
+
+    def test_turn_14_description_escapes_descriptions(self):
+        turn_14_data = types.SimpleNamespace(
+            descriptions=[
+                {'type': 'Market Description', 'description': 'Bolt-on <fit> & finish'},
+                {'type': 'Features and Benefits', 'description': '<i>Lightweight</i>'},
+                {'type': 'Associated Comments', 'description': 'Prop 65 & CARB; <see notes>'},
+            ],
+            files=[],
+        )
+
+        description = bigcommerce_services._get_turn_14_description(turn_14_data)
+
+        self.assertIn('<p>Bolt-on &lt;fit&gt; &amp; finish</p>', description)
+        self.assertIn('<li>&lt;i&gt;Lightweight&lt;/i&gt;</li>', description)
+        self.assertIn('<li>Prop 65 &amp; CARB</li>', description)
+        self.assertIn('<li>&lt;see notes&gt;</li>', description)
+
+
+def _bigcommerce_part(**overrides):
+    fields = {
+        'brand_id': 12,
+        'product_title': 'Cold Air Intake',
+        'sku': 'ABC-123',
+        'mpn': '123',
+        'default_price': 199.99,
+        'cost': 120.5,
+        'msrp': 229.0,
+        'weight': 10.0,
+        'width': 12.0,
+        'height': None,
+        'depth': 0.0,
+        'description': '<p>Overview</p>',
+        'images': [
+            {'image_url': 'https://example.com/a.jpg', 'is_thumbnail': True},
+            {'image_url': 'https://example.com/b.jpg', 'is_thumbnail': False},
+        ],
+        'inventory': 7,
+        'custom_fields': [{'name': 'Finish', 'value': 'Black'}, {'name': 'Material', 'value': 'Steel'}],
+        'active': True,
+        'category': 'Air Intake',
+        'subcategory': 'Cold Air Intakes',
+        'fitments': [{'year': 2020, 'make': 'Ford', 'model': 'F-150'}],
+    }
+    fields.update(overrides)
+    return src_messages.BigCommercePart(**fields)
+
+
+class PartShallowDictTests(SimpleTestCase):
+    def test_shallow_dict_matches_asdict(self):
+        part = _bigcommerce_part()
+
+        self.assertEqual(bigcommerce_services._part_shallow_dict(part), dataclasses.asdict(part))
+
+    def test_shallow_dict_matches_asdict_with_default_fields(self):
+        part = _bigcommerce_part(category=None, subcategory=None, fitments=None, images=[], custom_fields=[])
+
+        self.assertEqual(bigcommerce_services._part_shallow_dict(part), dataclasses.asdict(part))
+
+    def test_part_to_dict_adds_availability_to_asdict_output(self):
+        part = _bigcommerce_part(inventory=7)
+
+        expected = dataclasses.asdict(part)
+        expected['availability_description'] = 'In Stock'
+        self.assertEqual(bigcommerce_services._bigcommerce_part_to_dict(part), expected)
+
+    def test_source_data_adds_brand_to_asdict_output(self):
+        part = _bigcommerce_part()
+        brand = types.SimpleNamespace(id=3, name='K&N')
+
+        expected = dataclasses.asdict(part)
+        expected['brand_id'] = 3
+        expected['brand_name'] = 'K&N'
+        self.assertEqual(bigcommerce_services._get_source_data_for_product(part, brand), expected)
+
+
+class ChangeDetectionTests(SimpleTestCase):
+    def test_compare_returns_no_changes_without_field_comparisons_when_fingerprints_match(self):
+        old_data = bigcommerce_services._bigcommerce_part_to_dict(_bigcommerce_part())
+        new_data = bigcommerce_services._bigcommerce_part_to_dict(_bigcommerce_part())
+
+        with mock.patch.object(bigcommerce_services, '_values_different') as values_different:
+            self.assertEqual(bigcommerce_services._compare_bigcommerce_parts(old_data, new_data), {})
+        values_different.assert_not_called()
+
+    def test_compare_reports_only_changed_fields(self):
+        old_data = bigcommerce_services._bigcommerce_part_to_dict(_bigcommerce_part())
+        new_data = bigcommerce_services._bigcommerce_part_to_dict(_bigcommerce_part(
+            default_price=189.99,
+            cost=120.504,
+            depth=None,
+            custom_fields=[{'name': 'Material', 'value': 'Steel'}, {'name': 'Finish', 'value': 'Black'}],
+        ))
+
+        changes = bigcommerce_services._compare_bigcommerce_parts(old_data, new_data)
+
+        self.assertEqual(changes, {'default_price': {'old': 199.99, 'new': 189.99}})
+
+    def test_list_of_dicts_compares_as_multiset(self):
+        first = {'name': 'Finish', 'value': 'Black'}
+        second = {'name': 'Material', 'value': 'Steel'}
+
+        self.assertFalse(bigcommerce_services._list_values_different([first, second], [second, first]))
+        self.assertTrue(bigcommerce_services._list_values_different([first, first], [first, second]))
+
+    def test_list_of_dicts_with_unhashable_values_falls_back_to_sorting(self):
+        first = {'name': 'Sizes', 'value': ['S', 'M']}
+        second = {'name': 'Colors', 'value': ['Red']}
+
+        self.assertFalse(bigcommerce_services._list_values_different([first, second], [second, first]))
+        self.assertTrue(
+            bigcommerce_services._list_values_different([first, second], [second, {'name': 'Sizes', 'value': ['S']}])
+        )
+
+    def test_fitments_compare_independent_of_order(self):
+        ford = {'year': 2020, 'make': 'Ford', 'model': 'F-150'}
+        ram = {'year': 2021, 'make': 'Ram', 'model': '1500'}
+
+        self.assertFalse(bigcommerce_services._list_values_different([ford, ram], [ram, ford]))
+        self.assertTrue(bigcommerce_services._list_values_different([ford, ram], [ford, ford]))
+
+    def test_numbers_compare_with_absolute_tolerance(self):
+        self.assertFalse(bigcommerce_services._values_different(10.0, 10.005))
+        self.assertFalse(bigcommerce_services._values_different(10, 10.0))
+        self.assertTrue(bigcommerce_services._values_different(10.0, 10.02))
+
+    def test_nan_always_registers_as_a_change(self):
+        self.assertTrue(bigcommerce_services._values_different(float('nan'), float('nan')))
+        self.assertTrue(bigcommerce_services._values_different(float('nan'), 1.0))
+
+    def test_dimensions_treat_none_and_zero_as_equal(self):
+        self.assertFalse(bigcommerce_services._dimension_values_different(None, 0.0))
+        self.assertFalse(bigcommerce_services._dimension_values_different(0, None))
+        self.assertTrue(bigcommerce_services._dimension_values_different(None, 1.5))
+
+
+class MinimizeRawDataTests(SimpleTestCase):
+    def test_keeps_only_read_back_keys(self):
+        response = {
+            'id': 77,
+            'sku': 'ABC-123',
+            'name': 'Cold Air Intake',
+            'price': 199.99,
+            'inventory_level': 4,
+            'brand_id': 12,
+            'description': '<p>' + 'x' * 5000 + '</p>',
+            'custom_fields': [{'id': 1, 'name': 'Finish', 'value': 'Black'}],
+            'images': [
+                {'id': 5, 'url_standard': 'https://cdn.example.com/a.jpg', 'is_thumbnail': True, 'url_zoom': 'z'},
+                'not-an-image',
+            ],
+        }
+
+        self.assertEqual(bigcommerce_services._minimize_raw_data(response), {
+            'id': 77,
+            'sku': 'ABC-123',
+            'name': 'Cold Air Intake',
+            'price': 199.99,
+            'inventory_level': 4,
+            'brand_id': 12,
+            'images': {'data': [{'id': 5, 'url_standard': 'https://cdn.example.com/a.jpg', 'is_thumbnail': True}]},
+        })
+
+    def test_reads_images_from_data_envelope_and_skips_missing_keys(self):
+        response = {'id': 77, 'images': {'data': [{'id': 5, 'url_standard': 'https://cdn.example.com/a.jpg'}]}}
+
+        self.assertEqual(bigcommerce_services._minimize_raw_data(response), {
+            'id': 77,
+            'images': {'data': [{'id': 5, 'url_standard': 'https://cdn.example.com/a.jpg', 'is_thumbnail': None}]},
+        })
+
+    def test_fetched_products_store_minimized_raw_data(self):
+        product_data = {'id': 77, 'sku': ' ABC-123 ', 'brand_id': 12, 'description': 'long'}
+        destination = types.SimpleNamespace(id=9)
+
+        [product] = bigcommerce_services._transform_products_data([product_data], destination)
+
+        self.assertEqual(product.raw_data, {'id': 77, 'sku': ' ABC-123 ', 'brand_id': 12})
+        self.assertEqual(product.sku, 'ABC-123')
+        self.assertEqual(product.external_brand_id, '12')
+
+
+class _FakePageFetcher:
+    """Executor stand-in that records submitted pages and only runs the ones listed in run_pages."""
+
+    def __init__(self, run_pages=None):
+        self.run_pages = run_pages
+        self.futures = {}
+
+    def submit(self, fetch_page, page):
+        future = Future()
+        if self.run_pages is None or page in self.run_pages:
+            try:
+                future.set_result(fetch_page(page=page))
+            except Exception as e:
+                future.set_exception(e)
+        self.futures[page] = future
+        return future
+
+
+def _page_source(total_pages):
+    def fetch_page(page):
+        next_page = None if page >= total_pages else page + 1
+        return ['item-{}'.format(page)], next_page, total_pages
+    return fetch_page
+
+
+class PrefetchPagesTests(SimpleTestCase):
+    def test_yields_every_page_and_requests_none_past_total_pages(self):
+        page_fetcher = _FakePageFetcher()
+
+        pages = [page for page, _ in bigcommerce_services._prefetch_pages(page_fetcher, _page_source(6))]
+
+        self.assertEqual(pages, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(sorted(page_fetcher.futures), [1, 2, 3, 4, 5, 6])
+
+    def test_single_page_requests_only_the_first_page(self):
+        page_fetcher = _FakePageFetcher()
+
+        pages = [page for page, _ in bigcommerce_services._prefetch_pages(page_fetcher, _page_source(1))]
+
+        self.assertEqual(pages, [1])
+        self.assertEqual(list(page_fetcher.futures), [1])
+
+    def test_keeps_at_most_prefetch_depth_requests_in_flight(self):
+        page_fetcher = _FakePageFetcher(run_pages={1})
+
+        pages = bigcommerce_services._prefetch_pages(page_fetcher, _page_source(20))
+        next(pages)
+        next(pages)
+
+        # Page 1 is done; pages 2 to 1 + _PAGE_PREFETCH_DEPTH are in flight and nothing beyond
+        self.assertEqual(sorted(page_fetcher.futures), list(range(1, bigcommerce_services._PAGE_PREFETCH_DEPTH + 2)))
+        pages.close()
+
+    def test_cancels_queued_requests_when_the_caller_stops(self):
+        page_fetcher = _FakePageFetcher(run_pages={1})
+
+        pages = bigcommerce_services._prefetch_pages(page_fetcher, _page_source(20))
+        next(pages)
+        page, _ = next(pages)
+        pages.close()
+
+        self.assertEqual(page, 2)
+        self.assertFalse(page_fetcher.futures[2].cancelled())
+        for queued_page in range(3, bigcommerce_services._PAGE_PREFETCH_DEPTH + 2):
+            self.assertTrue(page_fetcher.futures[queued_page].cancelled())
+
+    def test_stops_after_a_failed_page(self):
+        def fetch_page(page):
+            raise bigcommerce_exceptions.BigCommerceAPIException()
+
+        page_fetcher = _FakePageFetcher()
+
+        pages = [page for page, _ in bigcommerce_services._prefetch_pages(page_fetcher, fetch_page)]
+
+        self.assertEqual(pages, [1])
+        self.assertEqual(list(page_fetcher.futures), [1])
+
+
+def _create_category_response(category_ids):
+    def create_category(category_data):
+        return [
+            {
+                'category_id': next(category_ids),
+                'name': category['name'],
+                'parent_id': category['parent_id'],
+                'tree_id': category['tree_id'],
+            }
+            for category in category_data
+        ]
+    return create_category
+
+
+class PrepareBigCommerceCategoriesTests(SimpleTestCase):
+    def setUp(self):
+        self.destination = src_models.CompanyDestinations(id=9)
+        self.api_client = mock.Mock()
+        self.api_client.create_category.side_effect = _create_category_response(iter(range(200, 300)))
+
+    @mock.patch.object(src_models.BigCommerceCategories, 'objects')
+    def test_creates_only_missing_categories_then_subcategories_in_batches(self, categories_objects):
+        categories_objects.filter.return_value.order_by.return_value.values_list.return_value = [
+            ('Air Intake', 0, 100),
+        ]
+        long_subcategory = 'S' * 60
+        products = [
+            _bigcommerce_part(category='Air Intake', subcategory='Cold Air Intakes'),
+            _bigcommerce_part(category='Exhaust', subcategory=long_subcategory),
+            _bigcommerce_part(category='Exhaust', subcategory=long_subcategory),
+            _bigcommerce_part(category=None, subcategory='Ignored'),
+        ]
+        category_cache = {}
+
+        bigcommerce_services._prepare_bigcommerce_categories(products, self.destination, self.api_client, category_cache)
+
+        self.assertEqual(self.api_client.create_category.call_args_list, [
+            mock.call(category_data=[{'name': 'Exhaust', 'parent_id': 0, 'tree_id': 1, 'is_visible': True}]),
+            mock.call(category_data=[
+                {'name': 'Cold Air Intakes', 'parent_id': 100, 'tree_id': 1, 'is_visible': True},
+                {'name': 'S' * 50, 'parent_id': 200, 'tree_id': 1, 'is_visible': True},
+            ]),
+        ])
+        self.assertEqual(category_cache, {
+            ('Air Intake', 0, 1): 100,
+            ('Exhaust', 0, 1): 200,
+            ('Cold Air Intakes', 100, 1): 201,
+            ('S' * 50, 200, 1): 202,
+        })
+        self.assertEqual(categories_objects.bulk_create.call_count, 2)
+
+    @mock.patch.object(src_models.BigCommerceCategories, 'objects')
+    def test_makes_no_api_calls_when_every_category_exists(self, categories_objects):
+        categories_objects.filter.return_value.order_by.return_value.values_list.return_value = [
+            ('Air Intake', 0, 100),
+            ('Cold Air Intakes', 100, 101),
+        ]
+        category_cache = {}
+
+        bigcommerce_services._prepare_bigcommerce_categories(
+            [_bigcommerce_part(category='Air Intake', subcategory='Cold Air Intakes')],
+            self.destination, self.api_client, category_cache
+        )
+
+        self.api_client.create_category.assert_not_called()
+        categories_objects.bulk_create.assert_not_called()
+
+    @mock.patch.object(src_models.BigCommerceCategories, 'objects')
+    def test_cached_categories_skip_the_database_and_api(self, categories_objects):
+        category_cache = {('Air Intake', 0, 1): 100}
+
+        category_id = bigcommerce_services._get_or_create_bigcommerce_category(
+            category_name='Air Intake',
+            parent_id=0,
+            destination=self.destination,
+            api_client=self.api_client,
+            category_cache=category_cache,
+        )
+
+        self.assertEqual(category_id, 100)
+        categories_objects.filter.assert_not_called()
+        self.api_client.create_category.assert_not_called()
+
+
+_PRODUCT_PAGES = {
+    1: [{'id': 1, 'sku': 'A'}, {'id': 2, 'sku': 'B', 'name': 'old'}],
+    2: [{'id': 2, 'sku': 'B', 'name': 'new'}, {'id': 3, 'sku': 'C'}, {'id': 4, 'sku': 'D'}],
+    3: [{'id': 5, 'sku': 'E'}],
+}
+
+
+def _get_product_page(page):
+    next_page = None if page >= len(_PRODUCT_PAGES) else page + 1
+    return _PRODUCT_PAGES[page], next_page, len(_PRODUCT_PAGES)
+
+
+@mock.patch.object(bigcommerce_services, '_UPSERT_BATCH_SIZE', 3)
+@mock.patch.object(bigcommerce_services.pgbulk, 'upsert')
+@mock.patch.object(bigcommerce_services.bigcommerce_client, 'BigCommerceApiClient')
+@mock.patch.object(src_models.CompanyDestinations, 'objects')
+class FetchAndSaveBigCommerceProductsTests(SimpleTestCase):
+    def _run(self, destinations_objects, api_client_class):
+        destination = types.SimpleNamespace(id=9, credentials={}, company=types.SimpleNamespace(name='Acme'))
+        destinations_objects.filter.return_value.select_related.return_value = [destination]
+        api_client_class.return_value.get_products.side_effect = _get_product_page
+        bigcommerce_services.fetch_and_save_all_bigcommerce_products()
+
+    def test_batches_span_pages_and_keep_the_latest_copy_of_a_product(self, destinations_objects, api_client_class, upsert):
+        self._run(destinations_objects, api_client_class)
+
+        batches = [call.args[1] for call in upsert.call_args_list]
+        self.assertEqual([[product.external_id for product in batch] for batch in batches], [['1', '2', '3'], ['4', '5']])
+        self.assertEqual(batches[0][1].raw_data['name'], 'new')
+
+    def test_failed_batch_logs_its_page_range(self, destinations_objects, api_client_class, upsert):
+        upsert.side_effect = [Exception('duplicate key'), None]
+
+        with self.assertLogs(bigcommerce_services.logger, level='ERROR') as logs:
+            self._run(destinations_objects, api_client_class)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('pages: 1-2', logs.output[0])